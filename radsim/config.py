@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -400,6 +401,28 @@ def load_settings_file():
         return {}
 
 
+def write_private_file(path: Path, content: str) -> None:
+    """Atomically replace a file with content readable only by its owner.
+
+    The content goes to a 0600 temp file beside the target, which then
+    replaces it, so secrets are never readable by others, even briefly. The
+    temp file is removed if anything fails. A symlinked path is resolved
+    first, so the link keeps pointing at the updated file.
+    """
+    target = path.resolve()
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(content)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def save_config(api_key, provider, model):
     """Save config to .env file with secure permissions.
 
@@ -437,8 +460,7 @@ def save_config(api_key, provider, model):
 
     lines.append("")  # Trailing newline
 
-    ENV_FILE.write_text("\n".join(lines))
-    ENV_FILE.chmod(0o600)  # Secure: owner read/write only
+    write_private_file(ENV_FILE, "\n".join(lines))  # Secure: owner read/write only
 
 
 def save_reasoning_effort(effort: str) -> None:
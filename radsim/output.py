@@ -289,6 +289,8 @@ TEACH_COMMENT_WRAPPED = (
     "<!-- [teach]",
     f"<!-- {LEGACY_TEACH_MARKER}",
 )
+# Combined once at import so each check is a single str.startswith call
+_TEACH_PREFIXES = TEACH_COMMENT_PREFIXES + TEACH_COMMENT_WRAPPED
 
 
 def is_teach_comment(line):
@@ -297,12 +299,7 @@ def is_teach_comment(line):
     Returns True for lines that are inline teaching annotations
     (prefixed with # [teach], // [teach], etc.)
     """
-    stripped = line.strip()
-    if any(stripped.startswith(prefix) for prefix in TEACH_COMMENT_PREFIXES):
-        return True
-    if any(stripped.startswith(prefix) for prefix in TEACH_COMMENT_WRAPPED):
-        return True
-    return False
+    return line.lstrip().startswith(_TEACH_PREFIXES)
 
 
 def strip_teach_comments(content):
@@ -317,14 +314,16 @@ def strip_teach_comments(content):
     Returns:
         Clean code with teaching lines removed
     """
-    lines = content.split("\n")
-    clean_lines = [line for line in lines if not is_teach_comment(line)]
+    # Lines can only be teach comments when a marker appears somewhere
+    has_markers = "[teach]" in content or LEGACY_TEACH_MARKER in content
 
-    # Remove consecutive blank lines left by stripping
+    # Drop teach lines and collapse consecutive blank lines in one pass
     result_lines = []
     previous_blank = False
-    for line in clean_lines:
-        is_blank = line.strip() == ""
+    for line in content.split("\n"):
+        if has_markers and is_teach_comment(line):
+            continue
+        is_blank = not line or line.isspace()
         if is_blank and previous_blank:
             continue
         result_lines.append(line)
@@ -393,15 +392,16 @@ def style_teach_content(text):
     """
     if "[teach]" not in text and LEGACY_TEACH_MARKER not in text:
         return text
+    # Styling is a no-op without color, so skip classifying the lines
+    if not supports_color():
+        return text
 
-    lines = text.split("\n")
-    styled_lines = []
-    for line in lines:
-        if is_teach_comment(line):
-            styled_lines.append(colorize(line, "bright_magenta"))
-        else:
-            styled_lines.append(line)
-    return "\n".join(styled_lines)
+    return "\n".join(
+        colorize_ansi(line, "bright_magenta", COLORS, supports_color_fn=lambda: True)
+        if is_teach_comment(line)
+        else line
+        for line in text.split("\n")
+    )
 
 
 def print_agent_response(text):
@@ -707,54 +707,66 @@ def print_code_content(
     lines = content.split("\n")
     total_lines = len(lines)
 
+    # Probe the terminal once per render rather than once per colorized span
+    use_color = supports_color()
+
+    def paint(text, color):
+        return colorize_ansi(text, color, COLORS, supports_color_fn=lambda: use_color)
+
+    # Collect every row and emit them with a single write
+    out = []
+
     # Header
     if file_path:
-        header = colorize(f"  ┌─ {file_path} ", "dim") + colorize(f"({total_lines} lines)", "dim")
+        header = paint(f"  ┌─ {file_path} ", "dim") + paint(f"({total_lines} lines)", "dim")
         if highlight_teach:
-            header += colorize("  [teach] annotations shown in magenta", "bright_magenta")
-        print(header)
+            header += paint("  [teach] annotations shown in magenta", "bright_magenta")
+        out.append(header)
     else:
-        print(colorize("  ┌─ Code Content ", "dim") + colorize(f"({total_lines} lines)", "dim"))
+        out.append(paint("  ┌─ Code Content ", "dim") + paint(f"({total_lines} lines)", "dim"))
 
     def format_line(line_number, line_text):
         """Format a single line with line number, optionally highlighting teach comments."""
-        line_num_str = colorize(f"  │ {line_number:4d} │ ", "dim")
+        line_num_str = paint(f"  │ {line_number:4d} │ ", "dim")
+        is_teach = highlight_teach and is_teach_comment(line_text)
         # Wider limit for teach annotations (educational prose needs more room)
-        max_width = 120 if (highlight_teach and is_teach_comment(line_text)) else 80
+        max_width = 120 if is_teach else 80
         if len(line_text) > max_width:
             line_text = _truncate_text(line_text, max_width)
-        if highlight_teach and is_teach_comment(line_text):
-            return line_num_str + colorize(line_text, "bright_magenta")
+        if is_teach:
+            return line_num_str + paint(line_text, "bright_magenta")
         return line_num_str + line_text
 
     if collapsed and total_lines > 10:
         for i, line in enumerate(lines[:5], 1):
-            print(format_line(i, line))
+            out.append(format_line(i, line))
 
-        print(
-            colorize("  │  ... │ ", "dim")
-            + colorize(f"({total_lines - 8} more lines)", "gray")
+        out.append(
+            paint("  │  ... │ ", "dim")
+            + paint(f"({total_lines - 8} more lines)", "gray")
         )
 
         for i, line in enumerate(lines[-3:], total_lines - 2):
-            print(format_line(i, line))
+            out.append(format_line(i, line))
     elif max_lines and max_lines > 0:
         show_lines = lines[:max_lines]
         for i, line in enumerate(show_lines, 1):
-            print(format_line(i, line))
+            out.append(format_line(i, line))
 
         if total_lines > max_lines:
             remaining = total_lines - max_lines
-            print(
-                colorize("  │  ... │ ", "dim")
-                + colorize(f"({remaining} more lines - type S to see all)", "gray")
+            out.append(
+                paint("  │  ... │ ", "dim")
+                + paint(f"({remaining} more lines - type S to see all)", "gray")
             )
     else:
         # max_lines=0 or None means show ALL lines
         for i, line in enumerate(lines, 1):
-            print(format_line(i, line))
+            out.append(format_line(i, line))
 
-    print(colorize("  └──────────────────────────────────────────────", "dim"))
+    out.append(paint("  └──────────────────────────────────────────────", "dim"))
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 
 def print_thinking_step(step_text):
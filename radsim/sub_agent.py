@@ -9,6 +9,8 @@ import json
 import logging
 from collections.abc import Generator
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from types import MappingProxyType
 
 from .api_client import create_client
 from .config import load_env_file
@@ -16,7 +18,7 @@ from .config import load_env_file
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubAgentTask:
     """A task to be executed by a sub-agent."""
 
@@ -30,9 +32,9 @@ class SubAgentTask:
     max_iterations: int = 10  # Safety limit for agentic loop
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubAgentResult:
-    """Result from a sub-agent task execution."""
+    """Result from a sub-agent task execution (immutable once returned)."""
 
     success: bool
     content: str
@@ -61,11 +63,15 @@ def get_available_models() -> list[tuple[str, str]]:
     return list(PROVIDER_MODELS.get("openrouter", []))
 
 
+@cache
 def _build_model_aliases() -> dict[str, str]:
     """Build model aliases from the OpenRouter config list.
 
     Maps short names (derived from model IDs) to full model IDs.
     Only includes models from PROVIDER_MODELS["openrouter"].
+
+    The provider config is static, so the result is built once per process.
+    Callers share the returned dict and must not mutate it.
     """
     aliases = {}
     for model_id, _desc in get_available_models():
@@ -84,9 +90,16 @@ def _build_model_aliases() -> dict[str, str]:
 
     return aliases
 
+
+@cache
+def _get_full_model_ids() -> frozenset[str]:
+    """Return every full model ID a sub-agent may use (config models plus Haiku)."""
+    return frozenset(mid for mid, _desc in get_available_models()) | {HAIKU_MODEL}
+
+
 # Tool subsets for tiered access
 TOOL_SUBSETS = {
-    "read_only": [
+    "read_only": frozenset({
         "read_file",
         "read_many_files",
         "list_directory",
@@ -104,7 +117,7 @@ TOOL_SUBSETS = {
         "web_fetch",
         "todo_read",
         "submit_completion",
-    ],
+    }),
     "full": None,  # All tools available
 }
 
@@ -142,16 +155,16 @@ def resolve_model_name(model_name: str) -> str:
     Returns:
         Full OpenRouter model ID
     """
-    aliases = _build_model_aliases()
-
-    if model_name.lower() in aliases:
-        return aliases[model_name.lower()]
-
-    # Check if it's already a full model ID listed in config
-    config_model_ids = {mid for mid, _desc in get_available_models()}
-    config_model_ids.add(HAIKU_MODEL)
-    if model_name in config_model_ids:
-        return model_name
+    # Full IDs ("provider/model") are never aliases, so skip the alias lookup
+    # and only check the configured model list
+    if "/" in model_name:
+        if model_name in _get_full_model_ids():
+            return model_name
+    else:
+        # Aliases are built lazily on the first resolve, then served from cache
+        resolved = _build_model_aliases().get(model_name.lower())
+        if resolved:
+            return resolved
 
     # Unknown model — fall back to Haiku for safety
     logger.warning(f"Unknown sub-agent model '{model_name}', falling back to Haiku")
@@ -195,9 +208,15 @@ def list_available_models() -> dict[str, str]:
     return models
 
 
+@lru_cache(maxsize=8)
 def get_tools_for_tier(tier_name):
     """Return filtered tool definitions for a sub-agent tier.
 
+    Results are cached per tier name. Read-only subsets never include
+    custom tools, and full access returns the live TOOL_DEFINITIONS list,
+    so tools added at runtime are still picked up. Callers must not
+    mutate the returned list.
+
     Args:
         tier_name: One of 'fast', 'capable', 'review'.
 
@@ -212,10 +231,23 @@ def get_tools_for_tier(tier_name):
     if subset_name is None or TOOL_SUBSETS.get(subset_name) is None:
         return TOOL_DEFINITIONS  # Full access
 
-    allowed_tools = set(TOOL_SUBSETS[subset_name])
+    allowed_tools = TOOL_SUBSETS[subset_name]
     return [t for t in TOOL_DEFINITIONS if t["name"] in allowed_tools]
 
 
+@lru_cache(maxsize=8)
+def get_tool_names_for_tier(tier_name):
+    """Return the set of tool names available to a sub-agent tier.
+
+    Args:
+        tier_name: One of 'fast', 'capable', 'review'.
+
+    Returns:
+        Frozenset of tool names, derived from get_tools_for_tier().
+    """
+    return frozenset(t["name"] for t in get_tools_for_tier(tier_name))
+
+
 def resolve_task_config(task_description, tier="capable", model=None):
     """Resolve tier and model into final execution config.
 
@@ -225,18 +257,27 @@ def resolve_task_config(task_description, tier="capable", model=None):
         model: Optional model override (alias or full ID).
 
     Returns:
-        dict with 'model', 'max_tokens', 'tools'.
+        Read-only mapping with 'model', 'max_tokens', 'tools'. The result
+        is shared between callers; copy it with dict() before mutating.
     """
     tier_config = MODEL_TIERS.get(tier, MODEL_TIERS["capable"])
 
     resolved_model = model if model else tier_config["default_model"]
     resolved_model = resolve_model_name(resolved_model)
 
-    return {
+    return _resolve_task_config_cached(tier, resolved_model)
+
+
+@lru_cache(maxsize=64)
+def _resolve_task_config_cached(tier, resolved_model):
+    """Build the execution config for a (tier, resolved model) pair once."""
+    tier_config = MODEL_TIERS.get(tier, MODEL_TIERS["capable"])
+
+    return MappingProxyType({
         "model": resolved_model,
         "max_tokens": tier_config["max_tokens"],
         "tools": get_tools_for_tier(tier),
-    }
+    })
 
 
 def _execute_tool_calls(tool_use_blocks):
@@ -292,21 +333,6 @@ def _extract_text_from_response(response):
     return "\n".join(parts)
 
 
-def _response_has_tool_use(response):
-    """Check if an API response contains tool_use blocks.
-
-    Args:
-        response: API response dict
-
-    Returns:
-        True if any content block is type tool_use
-    """
-    for block in response.get("content", []):
-        if block.get("type") == "tool_use":
-            return True
-    return False
-
-
 def _get_tool_use_blocks(response):
     """Extract tool_use blocks from an API response.
 
@@ -366,7 +392,8 @@ def execute_subagent_task(task: SubAgentTask) -> SubAgentResult:
             total_output_tokens += usage.get("output_tokens", 0)
 
             # If no tools provided or no tool_use in response, we're done
-            if not tools or not _response_has_tool_use(response):
+            tool_use_blocks = _get_tool_use_blocks(response) if tools else []
+            if not tool_use_blocks:
                 content = _extract_text_from_response(response)
                 return SubAgentResult(
                     success=True,
@@ -378,7 +405,6 @@ def execute_subagent_task(task: SubAgentTask) -> SubAgentResult:
                 )
 
             # Execute tool calls and continue the loop
-            tool_use_blocks = _get_tool_use_blocks(response)
             tool_results = _execute_tool_calls(tool_use_blocks)
 
             # Append assistant response and tool results to conversation
@@ -466,7 +492,10 @@ def stream_subagent_task(task: SubAgentTask) -> Generator[dict, None, SubAgentRe
             total_output_tokens += usage.get("output_tokens", 0)
 
             # Check if the final response has tool_use blocks
-            if not tools or not final_response or not _response_has_tool_use(final_response):
+            tool_use_blocks = (
+                _get_tool_use_blocks(final_response) if tools and final_response else []
+            )
+            if not tool_use_blocks:
                 return SubAgentResult(
                     success=True,
                     content=full_content,
@@ -477,7 +506,6 @@ def stream_subagent_task(task: SubAgentTask) -> Generator[dict, None, SubAgentRe
                 )
 
             # Execute tools silently, yield status updates
-            tool_use_blocks = _get_tool_use_blocks(final_response)
             tool_names = [b.get("name", "?") for b in tool_use_blocks]
             yield {"type": "tool_status", "text": f"Running tools: {', '.join(tool_names)}"}
 
@@ -13,10 +13,15 @@ Features:
 import json
 import re
 import sqlite3
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default log directory
 LOG_DIR = Path.home() / ".radsim" / "logs"
 
@@ -31,6 +36,49 @@ SENSITIVE_PATTERNS = [
     "private_key",
 ]
 
+# Compiled once at import: each pattern followed by a separator and a value
+_SENSITIVE_REGEXES = tuple(
+    re.compile(rf'({pattern}["\'\s:=]+)[^\s",}}\]\n]+', re.IGNORECASE)
+    for pattern in SENSITIVE_PATTERNS
+)
+
+# The same passes without IGNORECASE, for matching against lowercased text
+_SENSITIVE_REGEXES_LOWER = tuple(re.compile(regex.pattern) for regex in _SENSITIVE_REGEXES)
+
+# Every pattern in one alternation, so a single scan tells whether any of
+# them is followed by a value to redact
+_SENSITIVE_ANY = re.compile(
+    rf'(?:{"|".join(map(re.escape, SENSITIVE_PATTERNS))})["\'\s:=]+[^\s",}}\]\n]',
+    re.IGNORECASE,
+)
+
+
+def _replace_spans(text: str, spans: list, replacement: str) -> str:
+    """Return text with each (start, end) span replaced by replacement."""
+    parts = []
+    last = 0
+    for start, end in spans:
+        parts.append(text[last:start])
+        parts.append(replacement)
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _redact_lowered(data: str, lowered: str) -> str:
+    """Run the redaction passes case-sensitively over ASCII text.
+
+    lowered is data.lower(). For ASCII text that agrees exactly with
+    re.IGNORECASE, so each pass finds its values in lowered and replaces
+    the same spans in both strings; data keeps its casing everywhere else.
+    """
+    for regex in _SENSITIVE_REGEXES_LOWER:
+        spans = [(match.end(1), match.end()) for match in regex.finditer(lowered)]
+        if spans:
+            data = _replace_spans(data, spans, "[REDACTED]")
+            lowered = _replace_spans(lowered, spans, "[redacted]")
+    return data
+
 
 def _sanitize_for_logging(data: str) -> str:
     """Remove sensitive values from log data.
@@ -41,16 +89,28 @@ def _sanitize_for_logging(data: str) -> str:
     if not data:
         return data
 
+    # Most entries contain no sensitive keyword at all; skip the regexes for
+    # them. ASCII text only: lower() agrees exactly with re.IGNORECASE there,
+    # while on other text IGNORECASE also matches "ı" to "i" and "ſ" to "s".
+    if data.isascii():
+        lowered = data.lower()
+        if not any(pattern in lowered for pattern in SENSITIVE_PATTERNS):
+            return data
+        return _redact_lowered(data, lowered)
+
+    # One combined scan settles the common nothing-to-redact case. Redaction
+    # itself keeps the ordered per-pattern passes: each pass rewrites the text
+    # the next one scans, which a single combined substitution cannot mimic.
+    if _SENSITIVE_ANY.search(data) is None:
+        return data
+
     sanitized = data
-    for pattern in SENSITIVE_PATTERNS:
-        # Match pattern followed by separator and value
-        sanitized = re.sub(
-            rf'({pattern}["\'\s:=]+)[^\s",}}\]\n]+', r"\1[REDACTED]", sanitized, flags=re.IGNORECASE
-        )
+    for regex in _SENSITIVE_REGEXES:
+        sanitized = regex.sub(r"\1[REDACTED]", sanitized)
     return sanitized
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A single log entry for the audit trail."""
 
@@ -78,6 +138,16 @@ class LogEntry:
     metadata: str = ""  # JSON string for extra data
 
 
+# Field names cached once; every LogEntry field is a flat str/int/float, so a
+# plain getattr dict is equivalent to asdict() without its deep copy
+_LOG_FIELDS = tuple(f.name for f in fields(LogEntry))
+
+
+def _entry_to_dict(entry: LogEntry) -> dict:
+    """Convert a LogEntry to a plain dict for JSON serialization."""
+    return {name: getattr(entry, name) for name in _LOG_FIELDS}
+
+
 class TaskLogger:
     """Structured logging system for RadSim.
 
@@ -149,9 +219,15 @@ class TaskLogger:
         """Save entry to both JSON and SQLite."""
         self._entries.append(entry)
 
-        # Save to JSON file
-        with open(self.json_path, "w") as f:
-            json.dump([asdict(e) for e in self._entries], f, indent=2)
+        # Save to JSON file (orjson serializes dataclasses natively when installed)
+        if orjson is not None:
+            self.json_path.write_bytes(orjson.dumps(self._entries, option=orjson.OPT_INDENT_2))
+        else:
+            # UTF-8 without ASCII escapes, matching what orjson writes
+            with open(self.json_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    [_entry_to_dict(e) for e in self._entries], f, indent=2, ensure_ascii=False
+                )
 
         # Save to SQLite
         conn = sqlite3.connect(self.db_path)
@@ -46,7 +46,7 @@ def save_telegram_config(token, chat_id):
     Raises:
         ValueError: If token or chat_id fail basic validation.
     """
-    from .config import CONFIG_DIR, ENV_FILE
+    from .config import CONFIG_DIR, ENV_FILE, write_private_file
 
     # --- Validate inputs ---
     if not token or not token.strip():
@@ -70,38 +70,33 @@ def save_telegram_config(token, chat_id):
     if ENV_FILE.exists():
         existing_lines = ENV_FILE.read_text().splitlines()
 
-    token_key = "TELEGRAM_BOT_TOKEN"
-    chat_key = "TELEGRAM_CHAT_ID"
-    token_found = False
-    chat_found = False
+    new_lines = {
+        "TELEGRAM_BOT_TOKEN": f'TELEGRAM_BOT_TOKEN="{token}"',
+        "TELEGRAM_CHAT_ID": f'TELEGRAM_CHAT_ID="{chat_id}"',
+    }
+    found_keys = set()
     clean_lines = []
 
+    # Single pass: swap matching KEY= lines in place, keep everything else
     for line in existing_lines:
-        stripped = line.strip()
-        if stripped.startswith(f"{token_key}="):
-            clean_lines.append(f'{token_key}="{token}"')
-            token_found = True
-        elif stripped.startswith(f"{chat_key}="):
-            clean_lines.append(f'{chat_key}="{chat_id}"')
-            chat_found = True
+        key, sep, _ = line.strip().partition("=")
+        if sep and key in new_lines:
+            clean_lines.append(new_lines[key])
+            found_keys.add(key)
         else:
             clean_lines.append(line)
 
     # Append any keys that weren't already present
-    if not token_found or not chat_found:
+    missing_keys = [key for key in new_lines if key not in found_keys]
+    if missing_keys:
         # Remove trailing blanks before appending section
         while clean_lines and clean_lines[-1].strip() == "":
             clean_lines.pop()
         clean_lines.append("")
         clean_lines.append("# Telegram Bot")
-        if not token_found:
-            clean_lines.append(f'{token_key}="{token}"')
-        if not chat_found:
-            clean_lines.append(f'{chat_key}="{chat_id}"')
-
-    new_content = "\n".join(clean_lines) + "\n"
-    ENV_FILE.write_text(new_content)
-    ENV_FILE.chmod(0o600)
+        clean_lines.extend(new_lines[key] for key in missing_keys)
+
+    write_private_file(ENV_FILE, "\n".join(clean_lines) + "\n")
 
 
 def send_telegram_message(message, token=None, chat_id=None):
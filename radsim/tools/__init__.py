@@ -4,6 +4,7 @@ import logging
 from importlib import import_module
 
 from .constants import DESTRUCTIVE_COMMANDS as DESTRUCTIVE_COMMANDS
+from .constants import MAX_SEARCH_RESULTS
 from .constants import PROTECTED_PATTERNS as PROTECTED_PATTERNS
 from .definitions import TOOL_DEFINITIONS as TOOL_DEFINITIONS
 
@@ -157,6 +158,7 @@ _TOOL_REGISTRY = {
         ("ignore_case", False),
         ("context_lines", 0),
         ("output_mode", "content"),
+        ("max_matches", MAX_SEARCH_RESULTS),
     ),
     "search_files": _build_tool_executor(
         ".search",
@@ -3,6 +3,8 @@
 RadSim Principle: Single Source of Truth
 """
 
+from .constants import MAX_SEARCH_RESULTS
+
 TOOL_DEFINITIONS = [
     # Browser Tools
     {
@@ -255,6 +257,13 @@ TOOL_DEFINITIONS = [
                     "enum": ["content", "files_only", "count"],
                     "default": "content",
                 },
+                "max_matches": {
+                    "type": "integer",
+                    "description": (
+                        f"Stop after this many matching lines (default: {MAX_SEARCH_RESULTS})"
+                    ),
+                    "default": MAX_SEARCH_RESULTS,
+                },
             },
             "required": ["pattern"],
         },
@@ -48,6 +48,9 @@ def read_file(file_path, offset=0, limit=None):
     Returns:
         dict with success, content, path, line_count
     """
+    if not file_path:
+        return {"success": False, "error": "Path cannot be empty"}
+
     is_safe, path, error = validate_path(file_path)
     if not is_safe:
         return {"success": False, "error": error}
@@ -136,6 +139,9 @@ def write_file(file_path, content, show_diff=True):
     Returns:
         dict with success, path, bytes_written
     """
+    if not file_path:
+        return {"success": False, "error": "Path cannot be empty"}
+
     is_safe, path, error = validate_path(file_path)
     if not is_safe:
         return {"success": False, "error": error}
@@ -159,8 +165,10 @@ def write_file(file_path, content, show_diff=True):
         # Create parent directories
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write the file
-        path.write_text(content, encoding="utf-8")
+        # Encode once and issue a single write; the payload length doubles
+        # as the bytes_written count below.
+        payload = content.encode("utf-8")
+        path.write_bytes(payload)
 
         # Show diff if file was modified (not created)
         if old_content is not None and old_content != content:
@@ -182,7 +190,7 @@ def write_file(file_path, content, show_diff=True):
         return {
             "success": True,
             "path": str(path),
-            "bytes_written": len(content.encode("utf-8")),
+            "bytes_written": len(payload),
             "is_new_file": is_new_file,
             "added_lines": added_lines,
             "removed_lines": removed_lines,
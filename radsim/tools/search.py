@@ -1,9 +1,11 @@
 """Search tools for RadSim (glob and grep)."""
 
 import fnmatch
+import os
 import re
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from .constants import MAX_SEARCH_RESULTS
@@ -44,6 +46,17 @@ SKIP_EXTENSIONS = frozenset(
 )
 MAX_SEARCH_SIZE = 500_000
 RG_MAX_FILE_SIZE = "500K"
+# A NUL byte in this many leading bytes marks a file as binary, as grep does
+BINARY_SNIFF_SIZE = 32_768
+# O_BINARY only exists (and matters) on Windows
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+# Any of these characters means the pattern needs the regex engine
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+# Regex constructs whose result can change when a line is searched inside its file:
+# lookarounds and inline flags, whole-string anchors, and possessive quantifiers
+# (which never give back a "\n" they have consumed)
+_LINE_CONTEXT_SENSITIVE = ("(?", "\\A", "\\Z", "\\z", "*+", "++", "?+", "}+")
 
 
 def _is_hidden_path(path):
@@ -51,35 +64,54 @@ def _is_hidden_path(path):
     return any(part.startswith(".") for part in path.parts)
 
 
-def _iter_searchable_files(base_path, file_pattern=None):
-    """Yield searchable files under a base path."""
-    for file_path in base_path.rglob("*"):
-        if not file_path.is_file():
-            continue
+def _compile_name_matcher(file_pattern):
+    """Compile a file name glob into a match function, as fnmatch.fnmatch would apply it."""
+    return re.compile(fnmatch.translate(os.path.normcase(file_pattern))).match
 
-        try:
-            relative_path = file_path.relative_to(base_path)
-        except ValueError:
-            relative_path = file_path
 
-        if _is_hidden_path(relative_path):
-            continue
+def _iter_searchable_files(base_path, name_match=None):
+    """Yield (path, size) for each searchable file under a base path.
 
-        if file_pattern and not fnmatch.fnmatch(file_path.name, file_pattern):
-            continue
+    Walks with os.scandir so file type checks come from the directory entry
+    instead of a stat per file. Hidden entries are pruned before descending,
+    and symlinked directories are not followed. name_match, when given, is a
+    compiled file name filter from _compile_name_matcher.
+    """
+    try:
+        entries = os.scandir(base_path)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
 
-        if file_path.suffix.lower() in SKIP_EXTENSIONS:
-            continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_searchable_files(entry.path, name_match)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
 
-        try:
-            file_size = file_path.stat().st_size
-        except OSError:
-            continue
+            if name_match is not None and not name_match(os.path.normcase(name)):
+                continue
 
-        if file_size > MAX_SEARCH_SIZE:
-            continue
+            if os.path.splitext(name)[1].lower() in SKIP_EXTENSIONS:
+                continue
 
-        yield file_path
+            try:
+                file_size = entry.stat().st_size
+            except OSError:
+                continue
+
+            if file_size > MAX_SEARCH_SIZE:
+                continue
+
+            yield entry.path, file_size
 
 
 def _normalize_relative_path(file_path):
@@ -125,8 +157,11 @@ def glob_files(pattern, directory_path="."):
         return {"success": False, "error": str(error)}
 
 
-def _build_grep_output(pattern, matches, files_searched, output_mode):
-    """Convert raw grep matches into the requested response shape."""
+def _build_grep_output(pattern, matches, files_searched, output_mode, truncated):
+    """Convert raw grep matches into the requested response shape.
+
+    truncated is True when a match beyond max_matches was found and dropped.
+    """
     if output_mode == "files_only":
         file_paths = sorted({match["file"] for match in matches})
         return {
@@ -135,6 +170,7 @@ def _build_grep_output(pattern, matches, files_searched, output_mode):
             "matches": file_paths,
             "count": len(file_paths),
             "files_searched": files_searched,
+            "truncated": truncated,
         }
 
     if output_mode == "count":
@@ -147,6 +183,7 @@ def _build_grep_output(pattern, matches, files_searched, output_mode):
             "matches": counts,
             "count": len(matches),
             "files_searched": files_searched,
+            "truncated": truncated,
         }
 
     return {
@@ -155,29 +192,194 @@ def _build_grep_output(pattern, matches, files_searched, output_mode):
         "matches": matches,
         "count": len(matches),
         "files_searched": files_searched,
+        "truncated": truncated,
     }
 
 
-def _grep_with_python(path, regex, file_pattern, context_lines):
-    """Python fallback for grep search."""
+@lru_cache(maxsize=256)
+def _compile_search_regex(pattern, ignore_case):
+    """Compile a grep pattern once per (pattern, ignore_case) pair."""
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+@lru_cache(maxsize=256)
+def _compile_file_prefilter(pattern, ignore_case):
+    """Compile a whole-file prefilter for a line-oriented pattern, or return None.
+
+    With MULTILINE, ^ and $ behave at line ends exactly as they do on a
+    single line, so any line match is also a match in the file text and a
+    file the prefilter rejects has no matching lines. That relies on
+    backtracking to give back anything matched past a line's end, so
+    possessive quantifiers are excluded, as are lookarounds, inline flags
+    and \\A/\\Z/\\z anchors, which can see past a line's ends.
+    """
+    if any(token in pattern for token in _LINE_CONTEXT_SENSITIVE):
+        return None
+    return re.compile(pattern, re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+
+
+def _is_literal_pattern(pattern):
+    """Return True when a pattern can be matched as a plain substring."""
+    return "\n" not in pattern and _REGEX_METACHARS.search(pattern) is None
+
+
+def _has_plain_lines(data):
+    """Return True when a bytes buffer can be searched line by line as bytes.
+
+    Decoding drops invalid UTF-8 and treats "\\r" as a line break, so only
+    valid UTF-8 without carriage returns splits into the same lines, holding
+    the same text, as the decoded file.
+    """
+    if b"\r" in data:
+        return False
+    if data.isascii():
+        return True
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _iter_literal_lines(data, needle):
+    """Yield (line_number, line) for each line of a bytes buffer containing needle.
+
+    The whole buffer is swept with bytes.find, so line boundaries are only
+    located around confirmed matches instead of splitting every line.
+    """
+    line_num = 1
+    counted_to = 0
+    index = data.find(needle)
+
+    while index != -1:
+        line_start = data.rfind(b"\n", 0, index) + 1
+        line_end = data.find(b"\n", index)
+        if line_end == -1:
+            line_end = len(data)
+
+        line_num += data.count(b"\n", counted_to, line_start)
+        counted_to = line_start
+        yield line_num, data[line_start:line_end].decode("utf-8", errors="ignore")
+
+        index = data.find(needle, line_end + 1)
+
+
+def _iter_regex_lines(text, regex, prefilter):
+    """Yield (line_number, line) for each line of text that regex matches.
+
+    For the patterns _compile_file_prefilter accepts, which can backtrack
+    out of anything matched past a line's end, the prefilter's leftmost
+    match from a line start never lies past the first line that really
+    matches. Each search therefore jumps straight to the next candidate
+    line. Lines in between are never split out, and line numbers are counted
+    incrementally with str.count.
+    """
+    line_num = 1
+    counted_to = 0
+    position = 0
+    text_length = len(text)
+
+    while position <= text_length:
+        found = prefilter.search(text, position)
+        if found is None:
+            return
+
+        line_start = text.rfind("\n", 0, found.start()) + 1
+        line_end = text.find("\n", found.start())
+        if line_end == -1:
+            line_end = text_length
+
+        line_num += text.count("\n", counted_to, line_start)
+        counted_to = line_start
+        line = text[line_start:line_end]
+        if regex.search(line):
+            yield line_num, line
+
+        position = line_end + 1
+
+
+def _read_text_bytes(file_path, file_size):
+    """Read a candidate file's bytes, or return None if it looks binary.
+
+    Sizes come from the walker's stat, so empty files are not opened at all.
+    Reads go straight to the file descriptor without a buffered file object;
+    files within the sniff window take a single read() call.
+    """
+    if file_size == 0:
+        return b""
+
+    fd = os.open(file_path, _READ_FLAGS)
+    try:
+        data = os.read(fd, BINARY_SNIFF_SIZE)
+        if b"\x00" in data:
+            return None
+        if len(data) < file_size or len(data) == BINARY_SNIFF_SIZE:
+            chunks = [data]
+            while chunk := os.read(fd, MAX_SEARCH_SIZE):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return data
+
+
+def _decode_text(data):
+    """Decode file bytes as text with universal newlines."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _grep_with_python(
+    path, regex, file_pattern, context_lines, max_matches, literal=None, prefilter=None
+):
+    """Python fallback for grep search.
+
+    Files with a NUL byte near the start are treated as binary and skipped.
+    When a literal pattern is given and no context is requested, each file
+    with plain "\\n" lines in valid UTF-8 is searched as one bytes buffer
+    rather than line by line. Otherwise an optional prefilter searches the
+    whole text, so non-matching files are rejected in one pass and only
+    candidate lines are checked line by line.
+    Scanning stops, across all files, once max_matches matches are found.
+    """
     matches = []
     files_searched = 0
+    needle = literal.encode("utf-8") if literal is not None and context_lines == 0 else None
+    name_match = _compile_name_matcher(file_pattern) if file_pattern else None
 
-    for file_path in _iter_searchable_files(path, file_pattern):
+    for file_path, file_size in _iter_searchable_files(path, name_match):
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+            data = _read_text_bytes(file_path, file_size)
+        except OSError:
             continue
 
-        lines = content.split("\n")
-        files_searched += 1
-
-        for line_num, line in enumerate(lines, 1):
-            if not regex.search(line):
-                continue
+        if data is None:
+            continue
 
+        files_searched += 1
+        lines = None
+
+        if needle is not None and _has_plain_lines(data):
+            hits = _iter_literal_lines(data, needle)
+        else:
+            text = _decode_text(data)
+            if prefilter is not None and context_lines == 0:
+                hits = _iter_regex_lines(text, regex, prefilter)
+            else:
+                if prefilter is not None and prefilter.search(text) is None:
+                    continue
+                lines = text.split("\n")
+                hits = (
+                    (line_num, line)
+                    for line_num, line in enumerate(lines, 1)
+                    if regex.search(line)
+                )
+
+        for line_num, line in hits:
             match_info = {
-                "file": _normalize_relative_path(file_path),
+                "file": _normalize_relative_path(Path(file_path)),
                 "line": line_num,
                 "content": line.strip()[:200],
             }
@@ -189,13 +391,13 @@ def _grep_with_python(path, regex, file_pattern, context_lines):
 
             matches.append(match_info)
 
-            if len(matches) >= MAX_SEARCH_RESULTS:
+            if len(matches) >= max_matches:
                 return matches, files_searched
 
     return matches, files_searched
 
 
-def _build_rg_command(pattern, file_pattern, ignore_case):
+def _build_rg_command(pattern, file_pattern, ignore_case, max_matches):
     """Build a ripgrep command for the fast path."""
     command = [
         "rg",
@@ -204,7 +406,7 @@ def _build_rg_command(pattern, file_pattern, ignore_case):
         "--color",
         "never",
         "--max-count",
-        str(MAX_SEARCH_RESULTS),
+        str(max_matches),
         "--max-filesize",
         RG_MAX_FILE_SIZE,
     ]
@@ -222,9 +424,13 @@ def _build_rg_command(pattern, file_pattern, ignore_case):
     return command
 
 
-def _grep_with_ripgrep(pattern, path, file_pattern, ignore_case):
-    """Run grep search through ripgrep when available."""
-    command = _build_rg_command(pattern, file_pattern, ignore_case)
+def _grep_with_ripgrep(pattern, path, file_pattern, ignore_case, max_matches):
+    """Run grep search through ripgrep when available.
+
+    ripgrep's --max-count is per file, so parsing stops once max_matches
+    matches have been collected overall.
+    """
+    command = _build_rg_command(pattern, file_pattern, ignore_case, max_matches)
     result = subprocess.run(
         command,
         cwd=str(path),
@@ -259,6 +465,9 @@ def _grep_with_ripgrep(pattern, path, file_pattern, ignore_case):
         )
         files_searched.add(relative_file)
 
+        if len(matches) >= max_matches:
+            break
+
     return matches, len(files_searched), None
 
 
@@ -269,35 +478,50 @@ def grep_search(
     ignore_case=False,
     context_lines=0,
     output_mode="content",
+    max_matches=MAX_SEARCH_RESULTS,
 ):
-    """Search file contents with regex."""
+    """Search file contents with regex, stopping after max_matches matches."""
     is_safe, path, error = validate_path(directory_path)
     if not is_safe:
         return {"success": False, "error": error}
 
+    if max_matches < 1:
+        return {"success": False, "error": "max_matches must be at least 1"}
+
     try:
-        regex_flags = re.IGNORECASE if ignore_case else 0
-        regex = re.compile(pattern, regex_flags)
+        regex = _compile_search_regex(pattern, bool(ignore_case))
     except re.error as error:
         return {"success": False, "error": f"Invalid regex: {error}"}
 
     matches = None
     files_searched = None
 
+    # Collect one match past the cap: finding it is what marks the result
+    # as truncated
+    limit = max_matches + 1
+
     if context_lines == 0 and shutil.which("rg"):
         matches, files_searched, error_result = _grep_with_ripgrep(
             pattern,
             path,
             file_pattern,
             ignore_case,
+            limit,
         )
         if error_result:
             return error_result
 
     if matches is None:
-        matches, files_searched = _grep_with_python(path, regex, file_pattern, context_lines)
+        literal = pattern if not ignore_case and _is_literal_pattern(pattern) else None
+        prefilter = _compile_file_prefilter(pattern, bool(ignore_case))
+        matches, files_searched = _grep_with_python(
+            path, regex, file_pattern, context_lines, limit, literal, prefilter
+        )
 
-    return _build_grep_output(pattern, matches, files_searched, output_mode)
+    truncated = len(matches) > max_matches
+    return _build_grep_output(
+        pattern, matches[:max_matches], files_searched, output_mode, truncated
+    )
 
 
 def search_files(pattern, directory_path=".", case_sensitive=False):
@@ -5,10 +5,29 @@ RadSim Principle: Explicit Over Implicit
 
 import os
 import subprocess
+import threading
+import time
 
 from .constants import MAX_ERROR_OUTPUT_SIZE, MAX_OUTPUT_SIZE
 from .validation import validate_shell_command
 
+# Characters read per call while discarding output past the size limit
+_DRAIN_CHUNK_SIZE = 65_536
+# Seconds to wait for the pipe readers to finish after killing a command
+_READER_JOIN_TIMEOUT = 1.0
+
+
+def _read_capped(stream, limit, output, key):
+    """Keep at most limit + 1 characters from a pipe and discard the rest.
+
+    The pipe is drained to EOF so the command never blocks on a full pipe,
+    but memory stays bounded however much it prints.
+    """
+    with stream:
+        output[key] = stream.read(limit + 1)
+        while stream.read(_DRAIN_CHUNK_SIZE):
+            pass
+
 
 def run_shell_command(command, timeout=120, working_dir=None):
     """Execute a shell command.
@@ -34,11 +53,51 @@ def run_shell_command(command, timeout=120, working_dir=None):
 
         cwd = working_dir or os.getcwd()
 
-        result = subprocess.run(shell_cmd, capture_output=True, text=True, timeout=timeout, cwd=cwd)
+        deadline = time.monotonic() + timeout
+        process = subprocess.Popen(
+            shell_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            cwd=cwd,
+        )
+
+        # Cap output while reading instead of buffering all of it first
+        output = {}
+        readers = [
+            threading.Thread(
+                target=_read_capped,
+                args=(process.stdout, MAX_OUTPUT_SIZE, output, "stdout"),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_read_capped,
+                args=(process.stderr, MAX_ERROR_OUTPUT_SIZE, output, "stderr"),
+                daemon=True,
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = process.wait(timeout=timeout)
+            for reader in readers:
+                reader.join(max(0.0, deadline - time.monotonic()))
+                if reader.is_alive():
+                    raise subprocess.TimeoutExpired(shell_cmd, timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            # Reap the killed process; its readers then see EOF unless a child
+            # it started still holds the pipes open
+            process.wait()
+            for reader in readers:
+                reader.join(_READER_JOIN_TIMEOUT)
+            raise
 
         # Truncate output if too large
-        stdout = result.stdout
-        stderr = result.stderr
+        stdout = output.get("stdout", "")
+        stderr = output.get("stderr", "")
 
         if len(stdout) > MAX_OUTPUT_SIZE:
             stdout = stdout[:MAX_OUTPUT_SIZE] + "\n... [Output truncated]"
@@ -46,10 +105,10 @@ def run_shell_command(command, timeout=120, working_dir=None):
             stderr = stderr[:MAX_ERROR_OUTPUT_SIZE] + "\n... [Error output truncated]"
 
         return {
-            "success": result.returncode == 0,
+            "success": returncode == 0,
             "stdout": stdout,
             "stderr": stderr,
-            "returncode": result.returncode,
+            "returncode": returncode,
         }
     except subprocess.TimeoutExpired:
         return {"success": False, "error": f"Command timed out after {timeout} seconds"}
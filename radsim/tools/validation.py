@@ -4,6 +4,8 @@ RadSim Principle: Explicit Safety Checks
 """
 
 import fnmatch
+import os
+import re
 import shlex
 from pathlib import Path
 from threading import RLock
@@ -16,14 +18,41 @@ _PATH_CACHE = {
 }
 _PATH_CACHE_LOCK = RLock()
 
+# Compiled once at import: fnmatch.fnmatch(name, pat) is
+# fnmatchcase(normcase(name), normcase(pat)), so normcase the patterns here
+# and the path per call to keep identical matching on every platform.
+_PROTECTED_MATCHERS = tuple(
+    (pattern, re.compile(fnmatch.translate(os.path.normcase(f"*{pattern}*"))).match)
+    for pattern in PROTECTED_PATTERNS
+)
+
+
+def _glob_search_body(pattern):
+    """Regex body that re.search can use in place of fnmatch's "*pattern*" match."""
+    translated = fnmatch.translate(os.path.normcase(pattern))
+    if translated.startswith("(?s:") and translated.endswith(")\\Z"):
+        return translated[4:-3]
+    # Unfamiliar translate() output: anchor the full "*pattern*" form instead
+    return rf"\A(?:{fnmatch.translate(os.path.normcase(f'*{pattern}*'))})"
+
+
+# All protected patterns in one alternation, so the common "not protected"
+# answer takes a single search; the ordered matchers above only run to name
+# the pattern once this has matched.
+_PROTECTED_ANY = re.compile(
+    "|".join(f"(?:{_glob_search_body(pattern)})" for pattern in PROTECTED_PATTERNS),
+    re.DOTALL,
+)
+
 
 def _get_resolved_cwd():
     """Return the resolved current working directory with cache invalidation."""
     with _PATH_CACHE_LOCK:
-        current_cwd = Path.cwd()
+        # Compare the raw getcwd() string; a Path is only built on change
+        current_cwd = os.getcwd()
         if _PATH_CACHE["cwd"] != current_cwd:
             _PATH_CACHE["cwd"] = current_cwd
-            _PATH_CACHE["resolved_cwd"] = current_cwd.resolve()
+            _PATH_CACHE["resolved_cwd"] = Path(current_cwd).resolve()
         return _PATH_CACHE["resolved_cwd"]
 
 
@@ -44,21 +73,22 @@ def validate_path(file_path, allow_outside=False):
     Returns:
         Tuple of (is_safe, resolved_path, error_message)
     """
-    if file_path is None:
+    if not file_path:
         return False, None, "Path cannot be empty"
 
     try:
         if not isinstance(file_path, str):
             file_path = str(file_path)
 
-        if not file_path.strip():
+        if file_path.isspace():
             return False, None, "Path cannot be empty"
 
         path = Path(file_path).resolve()
         cwd = _get_resolved_cwd()
 
-        # Check if path is inside cwd
-        is_inside = path == cwd or cwd in path.parents
+        # Check if path is inside cwd (both are resolved, so this is a
+        # prefix comparison of their parts, with no parents sequence built)
+        is_inside = path.is_relative_to(cwd)
 
         if not is_inside and not allow_outside:
             return False, None, f"Access denied: '{file_path}' is outside project directory"
@@ -77,9 +107,12 @@ def is_protected_path(file_path):
     Returns:
         Tuple of (is_protected, reason)
     """
-    path_lower = file_path.lower()
-    for pattern in PROTECTED_PATTERNS:
-        if fnmatch.fnmatch(path_lower, f"*{pattern}*"):
+    path_lower = os.path.normcase(file_path.lower())
+    if _PROTECTED_ANY.search(path_lower) is None:
+        return False, None
+
+    for pattern, matches in _PROTECTED_MATCHERS:
+        if matches(path_lower):
             return True, f"Protected file pattern: {pattern}"
     return False, None
 
@@ -105,8 +138,8 @@ def validate_shell_command(command):
     if not isinstance(command, str):
         return False, "Command must be a string"
 
-    # Strip and check for whitespace-only input
-    if not command.strip():
+    # Whitespace-only input (isspace avoids the copy strip() would make)
+    if command.isspace():
         return False, "Command cannot be empty"
 
     # ---------------------------------------------------------------
@@ -123,18 +156,24 @@ def validate_shell_command(command):
     # Phase 2: Parse with shlex and validate the parsed tokens.
     # ---------------------------------------------------------------
 
-    try:
-        parts = shlex.split(command)
-    except ValueError:
-        return False, "Invalid command format"
+    # shlex only matters for quotes and escapes; without them its tokens
+    # are exactly the whitespace-separated words.
+    if "'" in command or '"' in command or "\\" in command:
+        try:
+            parts = shlex.split(command)
+        except ValueError:
+            return False, "Invalid command format"
+    else:
+        parts = command.split()
 
     if not parts:
         return False, "Empty command"
 
-    # Check for path traversal in ALL parts (including the command name)
-    for part in parts:
-        if ".." in part:
-            return False, "Path traversal ('..') is forbidden in command"
+    # Check for path traversal in ALL parts (including the command name).
+    # Null bytes were rejected in phase 1, so joining on one cannot create a
+    # ".." across a token boundary and a single scan covers every part.
+    if ".." in "\x00".join(parts):
+        return False, "Path traversal ('..') is forbidden in command"
 
     # ---------------------------------------------------------------
     # Phase 3: Check against command policy (whitelist/blocklist).
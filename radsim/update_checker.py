@@ -11,6 +11,7 @@ Respects offline usage and caches results for 24 hours.
 import json
 import logging
 import os
+import re
 import time
 from pathlib import Path
 
@@ -22,18 +23,21 @@ CACHE_TTL_HOURS = 24
 GITHUB_API_URL = "https://api.github.com/repos/MBemera/Radsim/releases/latest"
 REQUEST_TIMEOUT = 3
 
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)*")
+
 
 def _cache_is_fresh() -> bool:
-    """Check if the cache file exists and is less than CACHE_TTL_HOURS old."""
+    """Check if the cache file exists and is less than CACHE_TTL_HOURS old.
+
+    Age comes from the file's mtime, which _save_cache refreshes on every
+    write, so no read or JSON parse is needed to answer.
+    """
     try:
-        if not CACHE_FILE.exists():
-            return False
-        data = json.loads(CACHE_FILE.read_text())
-        last_check = data.get("checked_at", 0)
-        age_hours = (time.time() - last_check) / 3600
-        return age_hours < CACHE_TTL_HOURS
-    except Exception:
+        modified_at = os.stat(CACHE_FILE).st_mtime
+    except OSError:
         return False
+    age_hours = (time.time() - modified_at) / 3600
+    return age_hours < CACHE_TTL_HOURS
 
 
 def _save_cache(latest_version: str):
@@ -54,29 +58,35 @@ def _get_cached_version() -> str | None:
     try:
         if not _cache_is_fresh():
             return None
-        data = json.loads(CACHE_FILE.read_text())
+        data = json.loads(CACHE_FILE.read_bytes())
         return data.get("latest_version")
     except Exception:
         return None
 
 
+def _parse_version(version: str) -> tuple[int, ...] | None:
+    """Parse a dotted numeric version into a tuple of ints, or None if malformed."""
+    if not isinstance(version, str) or not _VERSION_RE.fullmatch(version):
+        return None
+    return tuple(map(int, version.split(".")))
+
+
 def _version_is_newer(latest: str, current: str) -> bool:
     """Compare version strings (semver-style).
 
     Returns True if latest > current.
     """
-    try:
-        latest_parts = [int(x) for x in latest.split(".")]
-        current_parts = [int(x) for x in current.split(".")]
+    latest_parts = _parse_version(latest)
+    current_parts = _parse_version(current)
+    if latest_parts is None or current_parts is None:
+        return False
 
-        # Pad to same length
-        max_len = max(len(latest_parts), len(current_parts))
-        latest_parts.extend([0] * (max_len - len(latest_parts)))
-        current_parts.extend([0] * (max_len - len(current_parts)))
+    # Pad to same length
+    max_len = max(len(latest_parts), len(current_parts))
+    latest_parts += (0,) * (max_len - len(latest_parts))
+    current_parts += (0,) * (max_len - len(current_parts))
 
-        return latest_parts > current_parts
-    except (ValueError, AttributeError):
-        return False
+    return latest_parts > current_parts
 
 
 def check_for_updates(current_version: str) -> str | None:
@@ -109,7 +119,7 @@ def check_for_updates(current_version: str) -> str | None:
             headers={"Accept": "application/vnd.github.v3+json"},
         )
         with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-            data = json.loads(response.read().decode("utf-8"))
+            data = json.loads(response.read())
             latest_version = data.get("tag_name", "").lstrip("v")
 
             if not latest_version:
@@ -37,6 +37,40 @@ ALL_COLLECTIONS = [
     COLLECTION_USER_PREFERENCES,
     COLLECTION_PROJECT_CONTEXT,
 ]
+_VALID_COLLECTIONS = frozenset(ALL_COLLECTIONS)
+
+# Friendly category names accepted by remember(), mapped to collection names
+_CATEGORY_TO_COLLECTION = {
+    "conversation": COLLECTION_CONVERSATIONS,
+    "conversations": COLLECTION_CONVERSATIONS,
+    "code": COLLECTION_CODE_PATTERNS,
+    "code_pattern": COLLECTION_CODE_PATTERNS,
+    "code_patterns": COLLECTION_CODE_PATTERNS,
+    "preference": COLLECTION_USER_PREFERENCES,
+    "preferences": COLLECTION_USER_PREFERENCES,
+    "user_preference": COLLECTION_USER_PREFERENCES,
+    "user_preferences": COLLECTION_USER_PREFERENCES,
+    "project": COLLECTION_PROJECT_CONTEXT,
+    "project_context": COLLECTION_PROJECT_CONTEXT,
+}
+
+# Tokenizer and stopword list for keyword extraction, built once at import
+_WORD_PATTERN = re.compile(r'\b[a-z0-9]+\b')
+
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'can',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
+    'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
+    'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more',
+    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
+    'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and',
+    'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of',
+    'at', 'by', 'for', 'with', 'about', 'against', 'between',
+    'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off',
+})
 
 
 # =============================================================================
@@ -59,17 +93,21 @@ class JsonMemoryFallback:
         """
         self.persist_directory = persist_directory
         self.persist_directory.mkdir(parents=True, exist_ok=True)
+        # Collections are loaded lazily on first access so that a new
+        # instance only pays for the JSON files it actually touches.
         self.collections: dict[str, list[dict]] = {}
-        self._load_all_collections()
 
     def _get_collection_path(self, collection: str) -> Path:
         """Get the file path for a collection."""
         return self.persist_directory / f"{collection}.json"
 
-    def _load_all_collections(self) -> None:
-        """Load all collections from disk."""
-        for collection_name in ALL_COLLECTIONS:
-            self._load_collection(collection_name)
+    def _get_entries(self, collection: str) -> list[dict]:
+        """Return the entries for a collection, loading it from disk on first use."""
+        entries = self.collections.get(collection)
+        if entries is None:
+            self._load_collection(collection)
+            entries = self.collections[collection]
+        return entries
 
     def _load_collection(self, collection: str) -> None:
         """Load a single collection from disk."""
@@ -95,8 +133,7 @@ class JsonMemoryFallback:
 
     def add(self, collection: str, memory_id: str, content: str, metadata: dict) -> None:
         """Add a memory entry."""
-        if collection not in self.collections:
-            self.collections[collection] = []
+        entries = self._get_entries(collection)
 
         entry = {
             "id": memory_id,
@@ -104,15 +141,12 @@ class JsonMemoryFallback:
             "metadata": metadata,
             "keywords": list(self._extract_keywords(content)),  # Convert set to list for JSON
         }
-        self.collections[collection].append(entry)
+        entries.append(entry)
         self._save_collection(collection)
 
     def search(self, collection: str, query: str, top_k: int) -> list[dict]:
         """Search using TF-IDF cosine similarity and return scored results."""
-        if collection not in self.collections:
-            return []
-
-        entries = self.collections[collection]
+        entries = self._get_entries(collection)
         if not entries:
             return []
 
@@ -140,6 +174,16 @@ class JsonMemoryFallback:
             for kw in kw_set:
                 doc_freq[kw] = doc_freq.get(kw, 0) + 1
 
+        # IDF weight: log(N / df) — higher for rarer terms. Keywords are binary
+        # (present or absent), so every TF-IDF product reduces to idf^2 and the
+        # squared weights can be computed once per search instead of per entry.
+        idf_sq = {
+            term: (math.log((num_docs + 1) / (df + 1)) + 1.0) ** 2
+            for term, df in doc_freq.items()
+        }
+        unseen_idf_sq = (math.log(num_docs + 1) + 1.0) ** 2
+        query_norm = math.sqrt(sum(idf_sq.get(term, unseen_idf_sq) for term in query_keywords))
+
         scored_results = []
         for idx, entry in enumerate(entries):
             entry_keywords = entry_keyword_sets[idx]
@@ -151,21 +195,10 @@ class JsonMemoryFallback:
             if not shared_terms:
                 continue
 
-            # IDF weight: log(N / df) — higher for rarer terms
-            dot_product = 0.0
-            query_norm_sq = 0.0
-            entry_norm_sq = 0.0
-
-            all_terms = query_keywords | entry_keywords
-            for term in all_terms:
-                idf = math.log((num_docs + 1) / (doc_freq.get(term, 0) + 1)) + 1.0
-                q_tfidf = idf if term in query_keywords else 0.0
-                e_tfidf = idf if term in entry_keywords else 0.0
-                dot_product += q_tfidf * e_tfidf
-                query_norm_sq += q_tfidf * q_tfidf
-                entry_norm_sq += e_tfidf * e_tfidf
-
-            norm = math.sqrt(query_norm_sq) * math.sqrt(entry_norm_sq)
+            dot_product = sum(idf_sq[term] for term in shared_terms)
+            entry_norm = math.sqrt(sum(idf_sq[term] for term in entry_keywords))
+
+            norm = query_norm * entry_norm
             similarity = dot_product / norm if norm > 0 else 0.0
 
             scored_results.append({
@@ -181,13 +214,12 @@ class JsonMemoryFallback:
 
     def delete(self, collection: str, memory_id: str) -> bool:
         """Delete a memory by ID."""
-        if collection not in self.collections:
+        entries = self._get_entries(collection)
+        if not entries:
             return False
 
-        original_len = len(self.collections[collection])
-        self.collections[collection] = [
-            e for e in self.collections[collection] if e["id"] != memory_id
-        ]
+        original_len = len(entries)
+        self.collections[collection] = [e for e in entries if e["id"] != memory_id]
 
         if len(self.collections[collection]) < original_len:
             self._save_collection(collection)
@@ -196,7 +228,7 @@ class JsonMemoryFallback:
 
     def count(self, collection: str) -> int:
         """Get the count of memories in a collection."""
-        return len(self.collections.get(collection, []))
+        return len(self._get_entries(collection))
 
     def clear(self, collection: str) -> None:
         """Clear all memories in a collection."""
@@ -213,26 +245,10 @@ class JsonMemoryFallback:
             return set()
 
         # Tokenize: lowercase and split on non-word characters
-        words = re.findall(r'\b[a-z0-9]+\b', text.lower())
-
-        # Common stopwords to filter
-        stopwords = {
-            'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-            'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'must', 'can',
-            'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she',
-            'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
-            'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more',
-            'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only',
-            'own', 'same', 'so', 'than', 'too', 'very', 'just', 'and',
-            'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of',
-            'at', 'by', 'for', 'with', 'about', 'against', 'between',
-            'into', 'through', 'during', 'before', 'after', 'above',
-            'below', 'to', 'from', 'up', 'down', 'in', 'out', 'on', 'off',
-        }
+        words = _WORD_PATTERN.findall(text.lower())
 
         # Filter: keep words with 3+ chars that aren't stopwords
-        keywords = {w for w in words if len(w) >= 3 and w not in stopwords}
+        keywords = {w for w in words if len(w) >= 3 and w not in _STOPWORDS}
 
         return keywords
 
@@ -285,7 +301,7 @@ class VectorMemory:
         Returns:
             True if valid, False otherwise
         """
-        if collection not in ALL_COLLECTIONS:
+        if collection not in _VALID_COLLECTIONS:
             logger.warning(
                 f"Invalid collection: {collection}. "
                 f"Valid collections: {ALL_COLLECTIONS}"
@@ -310,11 +326,11 @@ class VectorMemory:
         Returns:
             The generated memory ID, or empty string if failed
         """
-        if not self._validate_collection(collection):
+        if not content or content.isspace():
+            logger.warning("Cannot add empty content to memory")
             return ""
 
-        if not content or not content.strip():
-            logger.warning("Cannot add empty content to memory")
+        if not self._validate_collection(collection):
             return ""
 
         try:
@@ -363,11 +379,11 @@ class VectorMemory:
         Returns:
             List of matching memories with id, content, metadata, and distance
         """
-        if not self._validate_collection(collection):
+        if not query or query.isspace():
+            logger.warning("Cannot search with empty query")
             return []
 
-        if not query or not query.strip():
-            logger.warning("Cannot search with empty query")
+        if not self._validate_collection(collection):
             return []
 
         try:
@@ -389,11 +405,11 @@ class VectorMemory:
         Returns:
             True if deleted successfully, False otherwise
         """
-        if not self._validate_collection(collection):
+        if not memory_id or memory_id.isspace():
+            logger.warning("Cannot delete memory: no ID provided")
             return False
 
-        if not memory_id:
-            logger.warning("Cannot delete memory: no ID provided")
+        if not self._validate_collection(collection):
             return False
 
         try:
@@ -424,7 +440,7 @@ class VectorMemory:
         Returns:
             Combined context string from relevant memories
         """
-        if not query or not query.strip():
+        if not query or query.isspace():
             return ""
 
         try:
@@ -554,22 +570,7 @@ def remember(content: str, category: str, metadata: dict | None = None) -> str:
         ...     {"confidence": "high"}
         ... )
     """
-    # Map friendly category names to collection names
-    category_map = {
-        "conversation": COLLECTION_CONVERSATIONS,
-        "conversations": COLLECTION_CONVERSATIONS,
-        "code": COLLECTION_CODE_PATTERNS,
-        "code_pattern": COLLECTION_CODE_PATTERNS,
-        "code_patterns": COLLECTION_CODE_PATTERNS,
-        "preference": COLLECTION_USER_PREFERENCES,
-        "preferences": COLLECTION_USER_PREFERENCES,
-        "user_preference": COLLECTION_USER_PREFERENCES,
-        "user_preferences": COLLECTION_USER_PREFERENCES,
-        "project": COLLECTION_PROJECT_CONTEXT,
-        "project_context": COLLECTION_PROJECT_CONTEXT,
-    }
-
-    collection = category_map.get(category.lower())
+    collection = _CATEGORY_TO_COLLECTION.get(category.lower())
     if not collection:
         logger.warning(
             f"Unknown category: {category}. "
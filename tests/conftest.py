@@ -1,5 +1,9 @@
 """Shared test configuration and fixtures for RadSim tests."""
 
+import io
+import os
+import subprocess
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +14,17 @@ def tmp_project(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def project_dir(tmp_path):
+    """Run the test from inside tmp_path, restoring the previous cwd afterwards."""
+    previous_cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(previous_cwd)
+
+
 @pytest.fixture
 def mock_env(monkeypatch):
     """Clear RadSim environment variables for isolated tests."""
@@ -24,3 +39,37 @@ def mock_env(monkeypatch):
     ]
     for var in env_vars_to_clear:
         monkeypatch.delenv(var, raising=False)
+
+
+class _FakePopen:
+    """Stand-in for subprocess.Popen; run_shell_command only uses these members."""
+
+    def __init__(self, returncode=0, stdout="", stderr="", hangs=False):
+        self.returncode = returncode
+        self.stdout = io.StringIO(stdout)
+        self.stderr = io.StringIO(stderr)
+        self.hangs = hangs
+        self.killed = False
+        self.reaped = False
+
+    def wait(self, timeout=None):
+        if self.hangs and not self.killed:
+            raise subprocess.TimeoutExpired(cmd="fake", timeout=timeout)
+        self.reaped = True
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def mock_popen():
+    """Patch the subprocess.Popen that run_shell_command starts commands with."""
+    with patch("radsim.tools.shell.subprocess.Popen") as mock:
+        yield mock
+
+
+@pytest.fixture
+def fake_process():
+    """Factory for fake Popen processes: fake_process(returncode, stdout, stderr, hangs)."""
+    return _FakePopen
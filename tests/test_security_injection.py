@@ -212,6 +212,12 @@ class TestPathTraversalInShell:
         assert is_valid is False
         assert error is not None
 
+    def test_dotdot_assembled_from_quotes(self):
+        """Quotes that shlex removes cannot hide a '..' from the check."""
+        is_valid, error = validate_shell_command("cat '.'./etc/passwd")
+        assert is_valid is False
+        assert "traversal" in error.lower()
+
 
 class TestEmptyAndMalformed:
     """Edge cases: empty, None, and malformed commands."""
@@ -408,7 +408,7 @@ class TestOversizedInput:
 
         # Create a file just over MAX_FILE_SIZE
         large_file = tmp_path / "oversized.txt"
-        large_file.write_text("x" * (MAX_FILE_SIZE + 1))
+        large_file.write_bytes(b"x" * (MAX_FILE_SIZE + 1))
 
         original_cwd = os.getcwd()
         try:
@@ -547,6 +547,11 @@ class TestEmptyNullInputs:
         result = memory.delete_memory(COLLECTION_CONVERSATIONS, "")
         assert result is False
 
+    def test_memory_delete_whitespace_id(self, tmp_path):
+        memory = VectorMemory(persist_directory=str(tmp_path / "vectors"))
+        result = memory.delete_memory(COLLECTION_CONVERSATIONS, "   ")
+        assert result is False
+
     def test_memory_invalid_collection(self, tmp_path):
         memory = VectorMemory(persist_directory=str(tmp_path / "vectors"))
         memory_id = memory.add_memory("invalid_collection", "test")
@@ -845,6 +850,18 @@ class TestJsonMemoryFallbackStress:
         fallback2 = JsonMemoryFallback(persist_dir)
         assert fallback2.count(COLLECTION_CONVERSATIONS) == 1
 
+    def test_collections_load_lazily(self, tmp_path):
+        """A new instance should only read collections when they are accessed."""
+        persist_dir = tmp_path / "lazy_test"
+
+        fallback1 = JsonMemoryFallback(persist_dir)
+        fallback1.add(COLLECTION_CODE_PATTERNS, "test_1", "Lazy loaded content", {})
+
+        fallback2 = JsonMemoryFallback(persist_dir)
+        assert fallback2.collections == {}
+        assert fallback2.count(COLLECTION_CODE_PATTERNS) == 1
+        assert list(fallback2.collections) == [COLLECTION_CODE_PATTERNS]
+
     def test_clear_and_count(self, tmp_path):
         """Clear should remove all entries; count should reflect that."""
         fallback = JsonMemoryFallback(tmp_path / "json_memory")
@@ -16,6 +16,7 @@ from radsim.sub_agent import (
     delegate_task,
     execute_subagent_task,
     get_available_models,
+    get_tool_names_for_tier,
     get_tools_for_tier,
     list_available_models,
     resolve_model_name,
@@ -23,12 +24,21 @@ from radsim.sub_agent import (
 )
 
 
+def _tool_names(tools):
+    """Return the names of a list of tool definitions."""
+    return frozenset(t["name"] for t in tools)
+
+
 class TestGetAvailableModels(unittest.TestCase):
     """Test that available models come from config."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._models = get_available_models()
+
     def test_returns_openrouter_models(self):
         """Available models come from PROVIDER_MODELS['openrouter']."""
-        models = get_available_models()
+        models = self._models
         assert isinstance(models, list)
         assert len(models) > 0
         # Each entry is a (model_id, description) tuple
@@ -38,12 +48,12 @@ class TestGetAvailableModels(unittest.TestCase):
 
     def test_contains_kimi(self):
         """Config should include kimi model."""
-        model_ids = [mid for mid, _desc in get_available_models()]
+        model_ids = [mid for mid, _desc in self._models]
         assert "moonshotai/kimi-k2.5" in model_ids
 
     def test_no_free_models(self):
         """No free models like qwen-coder should appear."""
-        model_ids = [mid for mid, _desc in get_available_models()]
+        model_ids = [mid for mid, _desc in self._models]
         for mid in model_ids:
             assert ":free" not in mid
 
@@ -71,10 +81,22 @@ class TestModelResolution(unittest.TestCase):
         result = resolve_model_name("nonexistent-model-xyz")
         assert result == HAIKU_MODEL
 
+    def test_unknown_full_model_id_falls_back_to_haiku(self):
+        """Full IDs outside the config list still fall back to Haiku."""
+        assert resolve_model_name("someone/unlisted-model") == HAIKU_MODEL
+
     def test_case_insensitive(self):
         """Alias resolution is case-insensitive."""
         assert resolve_model_name("HAIKU") == resolve_model_name("haiku")
 
+    def test_resolve_alias_glm(self):
+        """'glm' short alias resolves to the GLM config model."""
+        assert resolve_model_name("GLM") == "z-ai/glm-4.7"
+
+    def test_resolve_alias_minimax(self):
+        """'minimax' short alias resolves to the Minimax config model."""
+        assert resolve_model_name("minimax") == "minimax/minimax-m2.1"
+
     def test_resolve_config_short_name(self):
         """Short name derived from config model ID resolves."""
         # "moonshotai/kimi-k2.5" should create alias "kimi-k2.5" and "kimi"
@@ -107,21 +129,30 @@ class TestBuildModelAliases(unittest.TestCase):
 class TestListAvailableModels(unittest.TestCase):
     """Test listing available models."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._listed = list_available_models()
+
     def test_list_returns_config_models(self):
         """Listed models come from config."""
-        models = list_available_models()
-        assert isinstance(models, dict)
-        assert len(models) > 0
+        assert isinstance(self._listed, dict)
+        assert len(self._listed) > 0
 
     def test_list_includes_haiku(self):
         """List always includes Haiku."""
-        models = list_available_models()
-        assert HAIKU_MODEL in models
+        assert HAIKU_MODEL in self._listed
 
 
 class TestSubAgentTaskExecution(unittest.TestCase):
     """Test sub-agent task execution with mocked API."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client = MagicMock()
+
+    def setUp(self):
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+
     @patch("radsim.sub_agent.get_openrouter_api_key")
     def test_no_api_key_returns_error(self, mock_get_key):
         """Test error returned when no API key."""
@@ -142,7 +173,7 @@ class TestSubAgentTaskExecution(unittest.TestCase):
         """Test successful task execution."""
         mock_get_key.return_value = "test-api-key"
 
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_client.chat.return_value = {
             "content": [{"type": "text", "text": "Test response"}],
             "usage": {"input_tokens": 10, "output_tokens": 20},
@@ -267,8 +298,7 @@ class TestGetToolsForTier(unittest.TestCase):
 
     def test_fast_tier_limited_tools(self):
         """Fast tier returns a subset of tools."""
-        tools = get_tools_for_tier("fast")
-        tool_names = {t["name"] for t in tools}
+        tool_names = get_tool_names_for_tier("fast")
         assert "read_file" in tool_names
         assert "grep_search" in tool_names
         assert "write_file" not in tool_names
@@ -291,11 +321,28 @@ class TestGetToolsForTier(unittest.TestCase):
 
     def test_review_tier_read_only(self):
         """Review tier uses read-only tools."""
-        tools = get_tools_for_tier("review")
-        tool_names = {t["name"] for t in tools}
+        tool_names = get_tool_names_for_tier("review")
         assert "read_file" in tool_names
         assert "write_file" not in tool_names
 
+    def test_read_only_tier_keeps_definition_order(self):
+        """Filtered tools keep the order of TOOL_DEFINITIONS."""
+        from radsim.tools.definitions import TOOL_DEFINITIONS
+
+        tools = get_tools_for_tier("fast")
+        positions = [TOOL_DEFINITIONS.index(t) for t in tools]
+        assert positions == sorted(positions)
+
+    def test_tier_results_are_cached(self):
+        """Repeated lookups for a tier return the same list without refiltering."""
+        assert get_tools_for_tier("fast") is get_tools_for_tier("fast")
+
+    def test_tool_names_match_tier_tools(self):
+        """Tool-name set is derived from the tier's tool list."""
+        names = get_tool_names_for_tier("fast")
+        assert isinstance(names, frozenset)
+        assert names == {t["name"] for t in get_tools_for_tier("fast")}
+
 
 class TestResolveTaskConfig(unittest.TestCase):
     """Test resolve_task_config function."""
@@ -324,6 +371,14 @@ class TestResolveTaskConfig(unittest.TestCase):
         config = resolve_task_config("task", tier="fast", model="haiku")
         assert config["model"] == HAIKU_MODEL
 
+    def test_config_is_cached_and_read_only(self):
+        """Same (tier, model) pair returns one shared, read-only config."""
+        first = resolve_task_config("task one", tier="fast")
+        second = resolve_task_config("task two", tier="fast", model="haiku")
+        assert first is second
+        with self.assertRaises(TypeError):
+            first["max_tokens"] = 1
+
 
 class TestToolSubsets(unittest.TestCase):
     """Test TOOL_SUBSETS configuration."""
@@ -331,7 +386,7 @@ class TestToolSubsets(unittest.TestCase):
     def test_read_only_subset_exists(self):
         """read_only subset is defined."""
         assert "read_only" in TOOL_SUBSETS
-        assert isinstance(TOOL_SUBSETS["read_only"], list)
+        assert isinstance(TOOL_SUBSETS["read_only"], frozenset)
 
     def test_full_subset_is_none(self):
         """full subset is None (means all tools)."""
@@ -382,13 +437,20 @@ class TestSubAgentTaskDefaults(unittest.TestCase):
 class TestAgenticLoop(unittest.TestCase):
     """Test the agentic tool loop in execute_subagent_task."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client = MagicMock()
+
+    def setUp(self):
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+
     @patch("radsim.sub_agent.get_openrouter_api_key")
     @patch("radsim.sub_agent.create_client")
     def test_tool_use_then_text(self, mock_create_client, mock_get_key):
         """Model calls a tool then returns text — verify 2 API calls."""
         mock_get_key.return_value = "test-key"
 
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         tool_response = {
             "content": [
                 {"type": "tool_use", "id": "tool_1", "name": "read_file", "input": {"file_path": "test.py"}},
@@ -427,7 +489,7 @@ class TestAgenticLoop(unittest.TestCase):
         """Model endlessly requesting tools stops at max_iterations."""
         mock_get_key.return_value = "test-key"
 
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         infinite_tool_response = {
             "content": [
                 {"type": "tool_use", "id": "tool_1", "name": "read_file", "input": {"file_path": "x.py"}},
@@ -461,7 +523,7 @@ class TestAgenticLoop(unittest.TestCase):
         """No tools means single API call with no loop."""
         mock_get_key.return_value = "test-key"
 
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_client.chat.return_value = {
             "content": [{"type": "text", "text": "Simple response"}],
             "usage": {"input_tokens": 10, "output_tokens": 20},
@@ -522,13 +584,13 @@ class TestTierToolWiring(unittest.TestCase):
     def test_fast_config_includes_web_fetch(self):
         """Fast tier tools include web_fetch."""
         config = resolve_task_config("fetch docs", tier="fast")
-        tool_names = {t["name"] for t in config["tools"]}
+        tool_names = _tool_names(config["tools"])
         assert "web_fetch" in tool_names
 
     def test_fast_config_excludes_write_tools(self):
         """Fast tier tools exclude write operations."""
         config = resolve_task_config("read something", tier="fast")
-        tool_names = {t["name"] for t in config["tools"]}
+        tool_names = _tool_names(config["tools"])
         assert "write_file" not in tool_names
         assert "run_shell_command" not in tool_names
 
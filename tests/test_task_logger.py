@@ -1,7 +1,8 @@
 """Tests for the Task Logger audit trail."""
 
+import json
 
-from radsim.task_logger import LogEntry, _sanitize_for_logging
+from radsim.task_logger import LogEntry, TaskLogger, _sanitize_for_logging
 
 
 class TestSanitizeLogging:
@@ -50,6 +51,31 @@ class TestSanitizeLogging:
         result = _sanitize_for_logging(data)
         assert "sk-123" not in result
 
+    def test_adjacent_and_overlapping_matches(self):
+        # Every pattern's pass sees the previous passes' output
+        assert _sanitize_for_logging("Token:asecret a") == "Token:[REDACTED] [REDACTED]"
+        assert _sanitize_for_logging("secret: access_code: X") == "secret: [REDACTED] [REDACTED]"
+        assert (
+            _sanitize_for_logging("secret\naccess_code\n:Sk-1")
+            == "secret\n[REDACTED]\n:[REDACTED]"
+        )
+
+    def test_case_insensitive_preserves_original_casing(self):
+        data = 'Header API_KEY="sk-123" Path=/Src'
+        assert _sanitize_for_logging(data) == 'Header API_KEY="[REDACTED]" Path=/Src'
+
+    def test_non_ascii_text_still_redacts(self):
+        data = 'Straße password=hunter2'
+        assert _sanitize_for_logging(data) == 'Straße password=[REDACTED]'
+
+    def test_text_without_keywords_returned_unchanged(self):
+        data = 'tool_output={"lines": 42, "path": "/src/app.py"}'
+        assert _sanitize_for_logging(data) is data
+
+    def test_non_ascii_keyword_spelling_is_redacted(self):
+        # re.IGNORECASE lets the dotless "ı" match the "i" in api_key
+        assert _sanitize_for_logging("apı_key=sk-1") == "apı_key=[REDACTED]"
+
 
 class TestLogEntry:
     """Test LogEntry dataclass."""
@@ -74,3 +100,33 @@ class TestLogEntry:
         assert entry.input_tokens == 0
         assert entry.output_tokens == 0
         assert entry.api_duration_ms == 0.0
+
+
+class TestTaskLoggerJsonFile:
+    """Test the per-session JSON audit file."""
+
+    def test_json_file_lists_all_entries(self, tmp_path):
+        task_logger = TaskLogger(session_id="sess-json", log_dir=tmp_path)
+        task_logger.log_api_call("model-x", "openrouter", 10, 20, 1.5)
+        task_logger.log_error("ValueError", "bad input", {"step": 2})
+
+        entries = json.loads(task_logger.json_path.read_text())
+        assert [e["event_type"] for e in entries] == ["api_call", "error"]
+        assert entries[0]["input_tokens"] == 10
+        assert entries[1]["metadata"] == '{"step": 2}'
+
+    def test_json_file_is_the_same_without_orjson(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(TaskLogger, "_now", lambda self: "2026-02-15T10:00:00")
+
+        def write_log(log_dir):
+            task_logger = TaskLogger(session_id="sess-json", log_dir=log_dir)
+            task_logger.log_message("user", "café ✓ 日本")
+            task_logger.log_api_call("model-x", "openrouter", 10, 20, 1.5)
+            return task_logger.json_path.read_bytes()
+
+        with_orjson = write_log(tmp_path / "orjson")
+        monkeypatch.setattr("radsim.task_logger.orjson", None)
+        without_orjson = write_log(tmp_path / "json")
+
+        assert without_orjson == with_orjson
+        assert "café ✓ 日本".encode() in without_orjson
@@ -9,6 +9,8 @@ Tests the full teach mode flow:
 
 from unittest.mock import patch
 
+import pytest
+
 from radsim.output import (
     get_last_written_file,
     set_last_written_file,
@@ -62,20 +64,34 @@ SELECT * FROM users;
 """
 
 
+@pytest.fixture(scope="module")
+def stripped_python():
+    return strip_teach_comments(SAMPLE_PYTHON_WITH_TEACH)
+
+
+@pytest.fixture(scope="module")
+def stripped_js():
+    return strip_teach_comments(SAMPLE_JS_WITH_TEACH)
+
+
+@pytest.fixture(scope="module")
+def stripped_mixed():
+    return strip_teach_comments(SAMPLE_MIXED_LANGUAGES)
+
+
 class TestFullStripPipeline:
     """Test that stripping produces clean code while preserving display content."""
 
-    def test_python_strip_preserves_real_code(self):
-        stripped = strip_teach_comments(SAMPLE_PYTHON_WITH_TEACH)
+    def test_python_strip_preserves_real_code(self, stripped_python):
+        stripped = stripped_python
         assert "import os" in stripped
         assert "load_dotenv()" in stripped
         assert "@dataclass" in stripped
         assert "class User:" in stripped
         assert "def get_user" in stripped
 
-    def test_python_strip_removes_all_teach_lines(self):
-        stripped = strip_teach_comments(SAMPLE_PYTHON_WITH_TEACH)
-        assert "[teach]" not in stripped
+    def test_python_strip_removes_all_teach_lines(self, stripped_python):
+        assert "[teach]" not in stripped_python
 
     def test_display_content_preserves_teach_lines(self):
         """display_content is just the original content - it keeps teach lines."""
@@ -85,21 +101,21 @@ class TestFullStripPipeline:
         assert "Dataclass auto-generates" in display_content
         assert "Parameterized queries prevent" in display_content
 
-    def test_stripped_and_display_differ(self):
-        stripped = strip_teach_comments(SAMPLE_PYTHON_WITH_TEACH)
+    def test_stripped_and_display_differ(self, stripped_python):
+        stripped = stripped_python
         display = SAMPLE_PYTHON_WITH_TEACH
         assert stripped != display
         assert len(stripped) < len(display)
 
-    def test_js_strip_pipeline(self):
-        stripped = strip_teach_comments(SAMPLE_JS_WITH_TEACH)
+    def test_js_strip_pipeline(self, stripped_js):
+        stripped = stripped_js
         assert "[teach]" not in stripped
         assert "const express" in stripped
         assert "app.use(express.json())" in stripped
         assert "app.get" in stripped
 
-    def test_mixed_language_strip(self):
-        stripped = strip_teach_comments(SAMPLE_MIXED_LANGUAGES)
+    def test_mixed_language_strip(self, stripped_mixed):
+        stripped = stripped_mixed
         assert "[teach]" not in stripped
         assert "import os" in stripped
         assert "const x = 1;" in stripped
@@ -107,9 +123,8 @@ class TestFullStripPipeline:
         assert "<div>Hello</div>" in stripped
         assert ".class { color: red; }" in stripped
 
-    def test_no_consecutive_blank_lines_after_strip(self):
-        stripped = strip_teach_comments(SAMPLE_PYTHON_WITH_TEACH)
-        assert "\n\n\n" not in stripped
+    def test_no_consecutive_blank_lines_after_strip(self, stripped_python):
+        assert "\n\n\n" not in stripped_python
 
 
 class TestSetLastWrittenFileWithDisplayContent:
@@ -8,6 +8,9 @@ Tests the three core behaviors:
 5. TEACH_MODE_PROMPT contains correct inline instructions
 """
 
+import pytest
+
+from radsim.modes import TEACH_MODE_PROMPT, ModeManager
 from radsim.output import (
     is_teach_comment,
     print_code_content,
@@ -16,6 +19,11 @@ from radsim.output import (
 )
 
 
+@pytest.fixture
+def manager():
+    return ModeManager()
+
+
 class TestIsTeachComment:
     """Test detection of teaching comment lines."""
 
@@ -112,6 +120,10 @@ line_two = 2
         content = "x = 1\ny = 2\n"
         assert strip_teach_comments(content) == content
 
+    def test_blank_lines_collapsed_without_teach_comments(self):
+        content = "x = 1\n\n\ny = 2\n"
+        assert strip_teach_comments(content) == "x = 1\n\ny = 2\n"
+
     def test_all_teach_comments(self):
         content = "# [teach] line one\n# [teach] line two\n# [teach] line three"
         result = strip_teach_comments(content)
@@ -207,41 +219,28 @@ class TestTeachModePrompt:
     """Test that the teach mode prompt has correct inline instructions."""
 
     def test_prompt_mentions_inline_comments(self):
-        from radsim.modes import TEACH_MODE_PROMPT
-
         assert "# [teach]" in TEACH_MODE_PROMPT
 
     def test_prompt_mentions_auto_stripping(self):
-        from radsim.modes import TEACH_MODE_PROMPT
-
         assert "auto" in TEACH_MODE_PROMPT.lower() or "strip" in TEACH_MODE_PROMPT.lower()
 
     def test_prompt_mentions_multiple_languages(self):
-        from radsim.modes import TEACH_MODE_PROMPT
-
         assert "// [teach]" in TEACH_MODE_PROMPT
         assert "<!-- [teach]" in TEACH_MODE_PROMPT
         assert "/* [teach]" in TEACH_MODE_PROMPT
         assert "-- [teach]" in TEACH_MODE_PROMPT
 
     def test_prompt_does_not_use_old_teach_tags(self):
-        from radsim.modes import TEACH_MODE_PROMPT
-
         assert "[TEACH]" not in TEACH_MODE_PROMPT
         assert "[/TEACH]" not in TEACH_MODE_PROMPT
 
     def test_prompt_has_mandatory_language(self):
-        from radsim.modes import TEACH_MODE_PROMPT
-
         # The strengthened prompt should include rejection/mandatory language
         prompt_upper = TEACH_MODE_PROMPT.upper()
         assert "MUST" in prompt_upper
         assert "REJECTED" in prompt_upper or "NON-NEGOTIABLE" in prompt_upper
 
-    def test_mode_manager_registers_teach(self):
-        from radsim.modes import ModeManager
-
-        manager = ModeManager()
+    def test_mode_manager_registers_teach(self, manager):
         mode = manager.get_mode("teach")
         assert mode is not None
         assert mode.name == "teach"
@@ -251,10 +250,7 @@ class TestTeachModePrompt:
 class TestTeachModeToggle:
     """Test that teach mode toggles correctly."""
 
-    def test_toggle_on_off(self):
-        from radsim.modes import ModeManager
-
-        manager = ModeManager()
+    def test_toggle_on_off(self, manager):
         is_active, msg = manager.toggle("teach")
         assert is_active is True
         assert "ON" in msg
@@ -263,19 +259,13 @@ class TestTeachModeToggle:
         assert is_active is False
         assert "OFF" in msg
 
-    def test_prompt_additions_when_active(self):
-        from radsim.modes import ModeManager
-
-        manager = ModeManager()
+    def test_prompt_additions_when_active(self, manager):
         manager.toggle("teach")
         additions = manager.get_prompt_additions()
         assert "[teach]" in additions
         assert "# [teach]" in additions
 
-    def test_no_prompt_additions_when_inactive(self):
-        from radsim.modes import ModeManager
-
-        manager = ModeManager()
+    def test_no_prompt_additions_when_inactive(self, manager):
         additions = manager.get_prompt_additions()
         assert additions == ""
 
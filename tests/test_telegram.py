@@ -9,23 +9,31 @@ import pytest
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def fake_env(tmp_path, monkeypatch):
-    """Set up a fake ~/.radsim directory with a clean .env."""
-    config_dir = tmp_path / ".radsim"
-    config_dir.mkdir()
-    env_file = config_dir / ".env"
-    env_file.write_text(
-        '# RadSim Configuration\n'
-        'RADSIM_PROVIDER="openrouter"\n'
-        'OPENROUTER_API_KEY="sk-test-key"\n'
-    )
-    env_file.chmod(0o600)
+INITIAL_ENV_CONTENT = (
+    '# RadSim Configuration\n'
+    'RADSIM_PROVIDER="openrouter"\n'
+    'OPENROUTER_API_KEY="sk-test-key"\n'
+)
 
+
+@pytest.fixture(scope="class")
+def _radsim_config_dir(tmp_path_factory):
+    """Create a fake ~/.radsim directory and point radsim.config at it once per class."""
     import radsim.config
-    monkeypatch.setattr(radsim.config, "CONFIG_DIR", config_dir)
-    monkeypatch.setattr(radsim.config, "ENV_FILE", env_file)
 
+    config_dir = tmp_path_factory.mktemp(".radsim")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(radsim.config, "CONFIG_DIR", config_dir)
+        mp.setattr(radsim.config, "ENV_FILE", config_dir / ".env")
+        yield config_dir
+
+
+@pytest.fixture
+def fake_env(_radsim_config_dir):
+    """Reset the fake ~/.radsim/.env to a clean state for each test."""
+    env_file = _radsim_config_dir / ".env"
+    env_file.write_text(INITIAL_ENV_CONTENT)
+    env_file.chmod(0o600)
     return env_file
 
 
@@ -65,8 +73,13 @@ class TestSaveTelegramConfig:
         assert 'TELEGRAM_BOT_TOKEN="1234567890:NewTokenNewToken"' in content
         assert 'TELEGRAM_CHAT_ID="2222222222"' in content
         # Only one occurrence of each key
-        assert content.count("TELEGRAM_BOT_TOKEN=") == 1
-        assert content.count("TELEGRAM_CHAT_ID=") == 1
+        keys = [
+            line.split("=", 1)[0]
+            for line in content.splitlines()
+            if "=" in line and not line.startswith("#")
+        ]
+        assert keys.count("TELEGRAM_BOT_TOKEN") == 1
+        assert keys.count("TELEGRAM_CHAT_ID") == 1
 
     def test_preserves_other_keys(self, fake_env):
         from radsim.telegram import save_telegram_config
@@ -109,6 +122,43 @@ class TestSaveTelegramConfig:
         save_telegram_config("1234567890:ABCdefGHIjklMNOpqrSTUvwxYZ", "7779435210")
         assert oct(fake_env.stat().st_mode & 0o777) == "0o600"
 
+    def test_tightens_loose_permissions_without_leftovers(self, fake_env):
+        from radsim.telegram import save_telegram_config
+
+        fake_env.chmod(0o644)
+        save_telegram_config("1234567890:ABCdefGHIjklMNOpqrSTUvwxYZ", "7779435210")
+        assert oct(fake_env.stat().st_mode & 0o777) == "0o600"
+        assert [p.name for p in fake_env.parent.iterdir()] == [".env"]
+
+    def test_failed_write_removes_temp_file(self, fake_env, monkeypatch):
+        from radsim.telegram import save_telegram_config
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("radsim.config.os.replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            save_telegram_config("1234567890:ABCdefGHIjklMNOpqrSTUvwxYZ", "7779435210")
+
+        assert fake_env.read_text() == INITIAL_ENV_CONTENT
+        assert [p.name for p in fake_env.parent.iterdir()] == [".env"]
+
+    def test_symlinked_env_file_stays_a_symlink(self, fake_env, tmp_path, monkeypatch):
+        import radsim.config
+        from radsim.telegram import save_telegram_config
+
+        link = tmp_path / ".env"
+        try:
+            link.symlink_to(fake_env)
+        except OSError:
+            pytest.skip("symlinks are not available")
+        monkeypatch.setattr(radsim.config, "ENV_FILE", link)
+
+        save_telegram_config("1234567890:ABCdefGHIjklMNOpqrSTUvwxYZ", "7779435210")
+
+        assert link.is_symlink()
+        assert 'TELEGRAM_CHAT_ID="7779435210"' in fake_env.read_text()
+
 
 # ---------------------------------------------------------------------------
 # load_telegram_config
@@ -167,40 +217,23 @@ class TestSendTelegramMessage:
         result = send_telegram_message("hello", token="", chat_id="123")
         assert result["success"] is False
 
-    def test_http_401_gives_token_hint(self, fake_env):
-        from urllib.error import HTTPError
-
-        from radsim.telegram import send_telegram_message
-
-        def mock_urlopen(*args, **kwargs):
-            raise HTTPError(
-                url="https://api.telegram.org", code=401,
-                msg="Unauthorized", hdrs=None, fp=None,
-            )
-
-        with patch("radsim.telegram.urlopen", side_effect=mock_urlopen):
-            result = send_telegram_message(
-                "hello", token="1234567890:FakeToken1234", chat_id="123"
-            )
-        assert result["success"] is False
-        assert "401" in result["error"]
-        assert "token" in result["error"].lower()
-
-    def test_http_400_gives_chat_id_hint(self, fake_env):
+    @pytest.mark.parametrize(
+        ("code", "msg", "hint"),
+        [(401, "Unauthorized", "token"), (400, "Bad Request", "chat_id")],
+    )
+    def test_http_error_gives_hint(self, fake_env, code, msg, hint):
         from urllib.error import HTTPError
 
         from radsim.telegram import send_telegram_message
 
-        def mock_urlopen(*args, **kwargs):
-            raise HTTPError(
-                url="https://api.telegram.org", code=400,
-                msg="Bad Request", hdrs=None, fp=None,
-            )
-
-        with patch("radsim.telegram.urlopen", side_effect=mock_urlopen):
+        error = HTTPError(
+            url="https://api.telegram.org", code=code,
+            msg=msg, hdrs=None, fp=None,
+        )
+        with patch("radsim.telegram.urlopen", side_effect=error):
             result = send_telegram_message(
                 "hello", token="1234567890:FakeToken1234", chat_id="123"
             )
         assert result["success"] is False
-        assert "400" in result["error"]
-        assert "chat_id" in result["error"].lower()
+        assert str(code) in result["error"]
+        assert hint in result["error"].lower()
@@ -4,6 +4,8 @@
 
 """Tests for todo_read / todo_write task tracking."""
 
+import pytest
+
 from radsim.todo import TaskStatus, TodoTracker, get_tracker, reset_tracker
 
 
@@ -17,23 +19,37 @@ class TestTodoTracker:
         assert result["todos"] == []
         assert "No tasks" in result["summary"]
 
-    def test_write_single_task(self):
-        result = self.tracker.write([{"description": "Fix the bug"}])
-        assert result["success"] is True
-        assert len(result["todos"]) == 1
-        assert result["todos"][0]["description"] == "Fix the bug"
-        assert result["todos"][0]["status"] == "pending"
-
-    def test_write_multiple_tasks(self):
-        result = self.tracker.write([
-            {"description": "Step 1", "status": "completed"},
-            {"description": "Step 2", "status": "in_progress"},
-            {"description": "Step 3", "status": "pending"},
-        ])
+    @pytest.mark.parametrize(
+        ("tasks", "expected_counts"),
+        [
+            ([{"description": "Fix the bug"}], {"pending": 1}),
+            (
+                [
+                    {"description": "Step 1", "status": "completed"},
+                    {"description": "Step 2", "status": "in_progress"},
+                    {"description": "Step 3", "status": "pending"},
+                ],
+                {"completed": 1, "in_progress": 1, "pending": 1},
+            ),
+            (
+                [
+                    {"description": "A", "status": "pending"},
+                    {"description": "B", "status": "completed"},
+                ],
+                {"pending": 1, "completed": 1},
+            ),
+        ],
+        ids=["single_task", "one_of_each", "zero_in_progress"],
+    )
+    def test_write_status_counts(self, tasks, expected_counts):
+        result = self.tracker.write(tasks)
         assert result["success"] is True
-        assert result["counts"]["completed"] == 1
-        assert result["counts"]["in_progress"] == 1
-        assert result["counts"]["pending"] == 1
+        assert [t["description"] for t in result["todos"]] == [
+            t["description"] for t in tasks
+        ]
+        assert result["counts"] == {
+            "pending": 0, "in_progress": 0, "completed": 0, **expected_counts
+        }
 
     def test_enforce_single_in_progress(self):
         result = self.tracker.write([
@@ -79,17 +95,12 @@ class TestTodoTracker:
         assert len(result["todos"]) == 1
         assert result["todos"][0]["description"] == "New task"
 
-    def test_zero_in_progress_allowed(self):
-        result = self.tracker.write([
-            {"description": "A", "status": "pending"},
-            {"description": "B", "status": "completed"},
-        ])
-        assert result["success"] is True
-        assert result["counts"]["in_progress"] == 0
-
 
 class TestSingleton:
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_tracker()
+        yield
         reset_tracker()
 
     def test_get_tracker_returns_same_instance(self):
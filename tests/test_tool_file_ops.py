@@ -4,6 +4,9 @@ One test, one thing. Clear names, obvious assertions.
 """
 
 
+import pytest
+
+from radsim.tools.constants import MAX_FILE_SIZE, MAX_TRUNCATED_SIZE
 from radsim.tools.file_ops import (
     delete_file,
     read_file,
@@ -12,6 +15,42 @@ from radsim.tools.file_ops import (
     write_file,
 )
 
+# Just over MAX_FILE_SIZE, so read_file rejects it
+_LARGE_PAYLOAD = b"x" * (MAX_FILE_SIZE + 1)
+# Within MAX_FILE_SIZE but over MAX_TRUNCATED_SIZE, so the content is truncated
+_TRUNCATED_PAYLOAD = b"a" * (MAX_TRUNCATED_SIZE + 1)
+
+
+# Run every test from inside its own temporary project directory
+pytestmark = pytest.mark.usefixtures("project_dir")
+
+
+def assert_ok(result, **expected):
+    """Assert a tool call succeeded and that the given result keys match."""
+    assert result["success"] is True, result
+    for key, value in expected.items():
+        assert result[key] == value, (key, result)
+
+
+@pytest.fixture(scope="module")
+def text_files(tmp_path_factory):
+    """Small read-only files for the read_file content tests, written once per module."""
+    root = tmp_path_factory.mktemp("text")
+    (root / "hello.txt").write_bytes(b"Hello World")
+    (root / "config.txt").write_bytes(b"DATA=value")
+    (root / "lines.txt").write_bytes(b"line0\nline1\nline2\nline3\nline4")
+    return root
+
+
+@pytest.fixture(scope="module")
+def big_files(tmp_path_factory):
+    """Oversized files for the size-limit tests, written once per module."""
+    root = tmp_path_factory.mktemp("big")
+    (root / "large.txt").write_bytes(_LARGE_PAYLOAD)
+    (root / "big.txt").write_bytes(_TRUNCATED_PAYLOAD)
+    return root
+
+
 # =============================================================================
 # read_file tests
 # =============================================================================
@@ -20,80 +59,61 @@ from radsim.tools.file_ops import (
 class TestReadFile:
     """Tests for read_file function."""
 
-    def test_read_existing_file_returns_content(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "hello.txt"
-        test_file.write_text("Hello World")
+    def test_read_existing_file_returns_content(self, text_files, monkeypatch):
+        monkeypatch.chdir(text_files)
 
         result = read_file("hello.txt")
 
-        assert result["success"] is True
-        assert result["content"] == "Hello World"
-        assert result["line_count"] == 1
-
-    def test_read_missing_file_returns_error(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+        assert_ok(result, content="Hello World", line_count=1)
 
-        result = read_file("nonexistent.txt")
+    @pytest.mark.parametrize(
+        ("path", "error_fragment"),
+        [
+            ("nonexistent.txt", "not found"),
+            ("/etc/passwd", "outside project"),
+        ],
+    )
+    def test_read_errors(self, path, error_fragment):
+        result = read_file(path)
 
         assert result["success"] is False
-        assert "not found" in result["error"].lower()
+        assert error_fragment in result["error"].lower()
 
-    def test_read_protected_env_file_still_readable(self, tmp_path, monkeypatch):
+    def test_read_protected_env_file_still_readable(self, text_files, monkeypatch):
         """read_file does NOT check protected patterns -- only write/replace do."""
-        monkeypatch.chdir(tmp_path)
-        env_file = tmp_path / "config.txt"
-        env_file.write_text("DATA=value")
+        monkeypatch.chdir(text_files)
 
         result = read_file("config.txt")
 
-        assert result["success"] is True
+        assert_ok(result)
         assert "DATA=value" in result["content"]
 
-    def test_read_file_outside_project_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = read_file("/etc/passwd")
-
-        assert result["success"] is False
-        assert "outside project" in result["error"].lower()
-
-    def test_read_large_file_rejected(self, tmp_path, monkeypatch):
+    def test_read_large_file_rejected(self, big_files, monkeypatch):
         """Files exceeding MAX_FILE_SIZE (100KB) are rejected."""
-        monkeypatch.chdir(tmp_path)
-        large_file = tmp_path / "large.txt"
-        large_file.write_text("x" * 200_000)
+        monkeypatch.chdir(big_files)
 
         result = read_file("large.txt")
 
         assert result["success"] is False
         assert "too large" in result["error"].lower()
 
-    def test_read_file_content_truncated_at_max_display_size(self, tmp_path, monkeypatch):
+    def test_read_file_content_truncated_at_max_display_size(self, big_files, monkeypatch):
         """Content exceeding MAX_TRUNCATED_SIZE (20KB) is truncated."""
-        monkeypatch.chdir(tmp_path)
-        # Create file just under MAX_FILE_SIZE but over MAX_TRUNCATED_SIZE
-        content = "a" * 50_000
-        big_file = tmp_path / "big.txt"
-        big_file.write_text(content)
+        monkeypatch.chdir(big_files)
 
         result = read_file("big.txt")
 
-        assert result["success"] is True
-        assert "Truncated" in result["content"]
-        assert len(result["content"]) < 50_000
+        assert_ok(result)
+        kept, notice = result["content"].split("\n", 1)
+        assert kept == "a" * MAX_TRUNCATED_SIZE
+        assert "Truncated" in notice
 
-    def test_read_file_with_offset_and_limit(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "lines.txt"
-        test_file.write_text("line0\nline1\nline2\nline3\nline4")
+    def test_read_file_with_offset_and_limit(self, text_files, monkeypatch):
+        monkeypatch.chdir(text_files)
 
         result = read_file("lines.txt", offset=1, limit=2)
 
-        assert result["success"] is True
-        assert result["content"] == "line1\nline2"
-        assert result["offset"] == 1
-        assert result["limit"] == 2
+        assert_ok(result, content="line1\nline2", offset=1, limit=2)
 
 
 # =============================================================================
@@ -104,65 +124,45 @@ class TestReadFile:
 class TestWriteFile:
     """Tests for write_file function."""
 
-    def test_write_new_file(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
+    def test_write_new_file(self, tmp_path):
         result = write_file("new.txt", "hello")
 
-        assert result["success"] is True
-        assert result["is_new_file"] is True
+        assert_ok(result, is_new_file=True)
         assert (tmp_path / "new.txt").read_text() == "hello"
 
-    def test_write_overwrites_existing_file(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+    def test_write_overwrites_existing_file(self, tmp_path):
         existing = tmp_path / "existing.txt"
         existing.write_text("old content")
 
         result = write_file("existing.txt", "new content", show_diff=False)
 
-        assert result["success"] is True
-        assert result["is_new_file"] is False
+        assert_ok(result, is_new_file=False)
         assert existing.read_text() == "new content"
 
-    def test_write_creates_parent_directories(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
+    def test_write_creates_parent_directories(self, tmp_path):
         result = write_file("deep/nested/dir/file.txt", "nested content")
 
-        assert result["success"] is True
+        assert_ok(result)
         assert (tmp_path / "deep/nested/dir/file.txt").read_text() == "nested content"
 
-    def test_write_protected_env_file_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = write_file(".env", "SECRET=bad")
-
-        assert result["success"] is False
-        assert "cannot write" in result["error"].lower()
-
-    def test_write_protected_credentials_file_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = write_file("credentials.json", "{}")
-
-        assert result["success"] is False
-        assert "cannot write" in result["error"].lower()
+    def test_write_returns_bytes_written(self):
+        result = write_file("size.txt", "abc")
 
-    def test_write_outside_project_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+        assert_ok(result, bytes_written=3)
 
-        result = write_file("/tmp/outside.txt", "data")
+    @pytest.mark.parametrize(
+        ("path", "error_fragment"),
+        [
+            (".env", "cannot write"),
+            ("credentials.json", "cannot write"),
+            ("/tmp/outside.txt", "outside project"),
+        ],
+    )
+    def test_write_rejected_paths(self, path, error_fragment):
+        result = write_file(path, "data")
 
         assert result["success"] is False
-        assert "outside project" in result["error"].lower()
-
-    def test_write_returns_bytes_written(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = write_file("size.txt", "abc")
-
-        assert result["success"] is True
-        assert result["bytes_written"] == 3
+        assert error_fragment in result["error"].lower()
 
 
 # =============================================================================
@@ -173,60 +173,53 @@ class TestWriteFile:
 class TestReplaceInFile:
     """Tests for replace_in_file function."""
 
-    def test_replace_single_occurrence(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello World")
+    TARGET_NAME = "test.txt"
+
+    @pytest.fixture
+    def target(self, tmp_path):
+        return tmp_path / self.TARGET_NAME
+
+    def test_replace_single_occurrence(self, target):
+        target.write_text("Hello World")
 
-        result = replace_in_file("test.txt", "World", "Python", show_diff=False)
+        result = replace_in_file(self.TARGET_NAME, "World", "Python", show_diff=False)
 
-        assert result["success"] is True
-        assert result["replacements_made"] == 1
-        assert test_file.read_text() == "Hello Python"
+        assert_ok(result, replacements_made=1)
+        assert target.read_text() == "Hello Python"
 
-    def test_replace_all_occurrences(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("foo bar foo baz foo")
+    def test_replace_all_occurrences(self, target):
+        target.write_text("foo bar foo baz foo")
 
         result = replace_in_file(
-            "test.txt", "foo", "qux", replace_all=True, show_diff=False
+            self.TARGET_NAME, "foo", "qux", replace_all=True, show_diff=False
         )
 
-        assert result["success"] is True
-        assert result["replacements_made"] == 3
-        assert test_file.read_text() == "qux bar qux baz qux"
+        assert_ok(result, replacements_made=3)
+        assert target.read_text() == "qux bar qux baz qux"
 
-    def test_replace_multiple_without_flag_fails(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("foo foo foo")
+    def test_replace_multiple_without_flag_fails(self, target):
+        target.write_text("foo foo foo")
 
-        result = replace_in_file("test.txt", "foo", "bar", show_diff=False)
+        result = replace_in_file(self.TARGET_NAME, "foo", "bar", show_diff=False)
 
         assert result["success"] is False
         assert "multiple" in result["error"].lower()
 
-    def test_replace_pattern_not_found(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Hello World")
+    def test_replace_pattern_not_found(self, target):
+        target.write_text("Hello World")
 
-        result = replace_in_file("test.txt", "MISSING", "replacement", show_diff=False)
+        result = replace_in_file(self.TARGET_NAME, "MISSING", "replacement", show_diff=False)
 
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
-    def test_replace_in_missing_file(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
+    def test_replace_in_missing_file(self):
         result = replace_in_file("nonexistent.txt", "a", "b", show_diff=False)
 
         assert result["success"] is False
         assert "not found" in result["error"].lower()
 
-    def test_replace_in_protected_file_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+    def test_replace_in_protected_file_rejected(self, tmp_path):
         env_file = tmp_path / ".env"
         env_file.write_text("KEY=value")
 
@@ -237,85 +230,51 @@ class TestReplaceInFile:
 
 
 # =============================================================================
-# delete_file tests
+# delete_file / rename_file tests
 # =============================================================================
 
 
-class TestDeleteFile:
-    """Tests for delete_file function."""
-
-    def test_delete_existing_file(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        target = tmp_path / "doomed.txt"
-        target.write_text("bye")
+class TestFileMutations:
+    """Tests for delete_file and rename_file against a shared two-file tree."""
 
-        result = delete_file("doomed.txt")
+    OPERATIONS = {"delete": delete_file, "rename": rename_file}
 
-        assert result["success"] is True
-        assert not target.exists()
+    @pytest.fixture(autouse=True)
+    def tree(self, tmp_path):
+        (tmp_path / "src.txt").write_text("source")
+        (tmp_path / "dest.txt").write_text("destination")
+        self.root = tmp_path
 
-    def test_delete_missing_file_returns_error(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+    def test_delete_existing_file(self):
+        result = delete_file("src.txt")
 
-        result = delete_file("ghost.txt")
+        assert_ok(result)
+        assert not (self.root / "src.txt").exists()
 
-        assert result["success"] is False
-        assert "not found" in result["error"].lower()
+    @pytest.mark.parametrize(
+        "target", ["new.txt", "subdir/moved.txt"], ids=["basic", "cross_directory"]
+    )
+    def test_rename_moves_content(self, target):
+        result = rename_file("src.txt", target)
 
-    def test_delete_outside_project_rejected(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+        assert_ok(result)
+        assert not (self.root / "src.txt").exists()
+        assert (self.root / target).read_text() == "source"
 
-        result = delete_file("/etc/important")
+    @pytest.mark.parametrize(
+        ("operation", "args", "error_fragment"),
+        [
+            ("delete", ("ghost.txt",), "not found"),
+            ("delete", ("/etc/important",), "outside project"),
+            ("rename", ("src.txt", "dest.txt"), "already exists"),
+            ("rename", ("nonexistent.txt", "new.txt"), "not found"),
+        ],
+        ids=["delete_missing", "delete_outside", "rename_onto_existing", "rename_missing"],
+    )
+    def test_mutation_errors(self, operation, args, error_fragment):
+        result = self.OPERATIONS[operation](*args)
 
         assert result["success"] is False
-        assert "outside project" in result["error"].lower()
-
-
-# =============================================================================
-# rename_file tests
-# =============================================================================
-
-
-class TestRenameFile:
-    """Tests for rename_file function."""
-
-    def test_rename_basic(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        old = tmp_path / "old.txt"
-        old.write_text("content")
-
-        result = rename_file("old.txt", "new.txt")
-
-        assert result["success"] is True
-        assert not old.exists()
-        assert (tmp_path / "new.txt").read_text() == "content"
-
-    def test_rename_cross_directory(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        old = tmp_path / "old.txt"
-        old.write_text("moved")
-
-        result = rename_file("old.txt", "subdir/moved.txt")
-
-        assert result["success"] is True
-        assert (tmp_path / "subdir/moved.txt").read_text() == "moved"
-
-    def test_rename_target_exists_fails(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        source = tmp_path / "source.txt"
-        source.write_text("source")
-        dest = tmp_path / "dest.txt"
-        dest.write_text("destination")
-
-        result = rename_file("source.txt", "dest.txt")
-
-        assert result["success"] is False
-        assert "already exists" in result["error"].lower()
-
-    def test_rename_missing_source_fails(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = rename_file("nonexistent.txt", "new.txt")
-
-        assert result["success"] is False
-        assert "not found" in result["error"].lower()
+        assert error_fragment in result["error"].lower()
+        assert (self.root / "src.txt").read_text() == "source"
+        assert (self.root / "dest.txt").read_text() == "destination"
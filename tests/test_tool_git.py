@@ -1,13 +1,17 @@
 """Tests for radsim/tools/git.py
 
-One test, one thing. Mock subprocess.run since git operations
+One test, one thing. Mock subprocess.Popen since git operations
 should not depend on a real repository.
 """
 
-from unittest.mock import MagicMock, patch
+import pytest
 
 from radsim.tools.git import git_add, git_diff, git_status
 
+# Patch subprocess.Popen for every test so no real git command runs
+pytestmark = pytest.mark.usefixtures("mock_popen")
+
+
 # =============================================================================
 # git_status tests
 # =============================================================================
@@ -16,45 +20,32 @@ from radsim.tools.git import git_add, git_diff, git_status
 class TestGitStatus:
     """Tests for git_status function."""
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_clean_repository(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="## main\n",
-            stderr="",
-        )
-
-        result = git_status()
-
-        assert result["success"] is True
-        assert "main" in result["stdout"]
-
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_dirty_repository_with_changes(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="## main\n M src/app.py\n?? new_file.txt\n",
-            stderr="",
-        )
+    @pytest.mark.parametrize(
+        ("returncode", "stdout", "stderr", "expect_success", "fragments"),
+        [
+            (0, "## main\n", "", True, ["main"]),
+            (
+                0,
+                "## main\n M src/app.py\n?? new_file.txt\n",
+                "",
+                True,
+                ["app.py", "new_file.txt"],
+            ),
+            (128, "", "fatal: not a git repository\n", False, []),
+        ],
+        ids=["clean", "dirty", "not_a_repo"],
+    )
+    def test_status_variants(
+        self, mock_popen, fake_process, returncode, stdout, stderr, expect_success, fragments
+    ):
+        mock_popen.return_value = fake_process(returncode, stdout, stderr)
 
         result = git_status()
 
-        assert result["success"] is True
-        assert "app.py" in result["stdout"]
-        assert "new_file.txt" in result["stdout"]
-
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_not_a_git_repo(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=128,
-            stdout="",
-            stderr="fatal: not a git repository\n",
-        )
-
-        result = git_status()
-
-        assert result["success"] is False
-        assert result["returncode"] == 128
+        assert result["success"] is expect_success
+        assert result["returncode"] == returncode
+        for fragment in fragments:
+            assert fragment in result["stdout"]
 
 
 # =============================================================================
@@ -65,12 +56,11 @@ class TestGitStatus:
 class TestGitAdd:
     """Tests for git_add function."""
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_add_specific_files(self, mock_run):
+    def test_add_specific_files(self, mock_popen, fake_process):
         # First call: git add, second call: git diff --cached --name-only
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="file1.py\nfile2.py\n", stderr=""),
+        mock_popen.side_effect = [
+            fake_process(0, "", ""),
+            fake_process(0, "file1.py\nfile2.py\n", ""),
         ]
 
         result = git_add(file_paths=["file1.py", "file2.py"])
@@ -79,11 +69,10 @@ class TestGitAdd:
         assert "file1.py" in result["staged_files"]
         assert "file2.py" in result["staged_files"]
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_add_all_files(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="everything.py\n", stderr=""),
+    def test_add_all_files(self, mock_popen, fake_process):
+        mock_popen.side_effect = [
+            fake_process(0, "", ""),
+            fake_process(0, "everything.py\n", ""),
         ]
 
         result = git_add(all_files=True)
@@ -97,24 +86,18 @@ class TestGitAdd:
         assert result["success"] is False
         assert "specify" in result["error"].lower()
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_add_fails_on_git_error(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=128,
-            stdout="",
-            stderr="fatal: not a git repository\n",
-        )
+    def test_add_fails_on_git_error(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(128, "", "fatal: not a git repository\n")
 
         result = git_add(file_paths=["file.py"])
 
         assert result["success"] is False
         assert "fatal" in result["error"].lower()
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_add_single_string_path_converted_to_list(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="", stderr=""),
-            MagicMock(returncode=0, stdout="single.py\n", stderr=""),
+    def test_add_single_string_path_converted_to_list(self, mock_popen, fake_process):
+        mock_popen.side_effect = [
+            fake_process(0, "", ""),
+            fake_process(0, "single.py\n", ""),
         ]
 
         result = git_add(file_paths="single.py")
@@ -131,68 +114,43 @@ class TestGitAdd:
 class TestGitDiff:
     """Tests for git_diff function."""
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_diff_with_changes(self, mock_run):
-        diff_output = (
-            "diff --git a/file.py b/file.py\n"
-            "--- a/file.py\n"
-            "+++ b/file.py\n"
-            "@@ -1,3 +1,3 @@\n"
-            "-old line\n"
-            "+new line\n"
-        )
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=diff_output,
-            stderr="",
-        )
-
-        result = git_diff()
-
-        assert result["success"] is True
-        assert "-old line" in result["stdout"]
-        assert "+new line" in result["stdout"]
-
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_diff_no_changes(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="",
-            stderr="",
-        )
+    @pytest.mark.parametrize(
+        "diff_output",
+        [
+            (
+                "diff --git a/file.py b/file.py\n"
+                "--- a/file.py\n"
+                "+++ b/file.py\n"
+                "@@ -1,3 +1,3 @@\n"
+                "-old line\n"
+                "+new line\n"
+            ),
+            "",
+        ],
+        ids=["with_changes", "no_changes"],
+    )
+    def test_diff_passes_output_through(self, mock_popen, fake_process, diff_output):
+        mock_popen.return_value = fake_process(0, diff_output, "")
 
         result = git_diff()
 
         assert result["success"] is True
-        assert result["stdout"] == ""
-
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_diff_staged_flag(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="staged changes\n",
-            stderr="",
-        )
-
-        result = git_diff(staged=True)
-
-        assert result["success"] is True
-        # Verify --staged was included in the command
-        called_command = mock_run.call_args[0][0]
-        command_string = " ".join(called_command)
-        assert "--staged" in command_string
+        assert result["stdout"] == diff_output
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_diff_specific_file(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="file-specific diff\n",
-            stderr="",
-        )
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_fragment"),
+        [
+            ({"staged": True}, "--staged"),
+            ({"file_path": "specific.py"}, "specific.py"),
+        ],
+        ids=["staged_flag", "specific_file"],
+    )
+    def test_diff_command_arguments(self, mock_popen, fake_process, kwargs, expected_fragment):
+        mock_popen.return_value = fake_process(0, "diff output\n", "")
 
-        result = git_diff(file_path="specific.py")
+        result = git_diff(**kwargs)
 
         assert result["success"] is True
-        called_command = mock_run.call_args[0][0]
+        called_command = mock_popen.call_args[0][0]
         command_string = " ".join(called_command)
-        assert "specific.py" in command_string
+        assert expected_fragment in command_string
@@ -1,5 +1,6 @@
 """Tests for the ToolResult universal response format."""
 
+import pytest
 
 from radsim.tool_result import ToolResult, wrap_tool_call
 
@@ -36,39 +37,37 @@ class TestToolResult:
         assert result.error == "timeout"
         assert result.data["attempt"] == 3
 
-    def test_to_dict_success(self):
-        result = ToolResult.ok(content="test")
-        d = result.to_dict()
-        assert d["success"] is True
-        assert "error" not in d
-        assert d["data"]["content"] == "test"
-
-    def test_to_dict_failure(self):
-        result = ToolResult.fail(error="broken")
-        d = result.to_dict()
-        assert d["success"] is False
-        assert d["error"] == "broken"
-
-    def test_to_dict_with_metadata(self):
-        result = ToolResult(
-            success=True,
-            data={"x": 1},
-            tool_name="read_file",
-            duration_ms=42.5,
-        )
-        d = result.to_dict()
-        assert d["tool_name"] == "read_file"
-        assert d["duration_ms"] == 42.5
-
-    def test_to_dict_omits_zero_duration(self):
-        result = ToolResult.ok(content="test")
-        d = result.to_dict()
-        assert "duration_ms" not in d
-
-    def test_to_dict_omits_empty_tool_name(self):
-        result = ToolResult.ok(content="test")
-        d = result.to_dict()
-        assert "tool_name" not in d
+    @pytest.mark.parametrize(
+        ("result", "expected"),
+        [
+            (
+                ToolResult.ok(content="test"),
+                {"success": True, "data": {"content": "test"}},
+            ),
+            (
+                ToolResult.fail(error="broken"),
+                {"success": False, "data": {}, "error": "broken"},
+            ),
+            (
+                ToolResult(
+                    success=True,
+                    data={"x": 1},
+                    tool_name="read_file",
+                    duration_ms=42.5,
+                ),
+                {
+                    "success": True,
+                    "data": {"x": 1},
+                    "tool_name": "read_file",
+                    "duration_ms": 42.5,
+                },
+            ),
+        ],
+        ids=["success", "failure", "with_metadata"],
+    )
+    def test_to_dict(self, result, expected):
+        # Exact equality also proves empty error/tool_name and zero duration are omitted
+        assert result.to_dict() == expected
 
     def test_from_legacy_success(self):
         legacy = {"success": True, "stdout": "hello", "returncode": 0}
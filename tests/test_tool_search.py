@@ -3,10 +3,35 @@
 One test, one thing. Use tmp_path for file system operations.
 """
 
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from radsim.tools.search import glob_files, grep_search
 
+# Over MAX_SEARCH_SIZE (500KB) so the Python fallback skips it
+_OVERSIZED_PAYLOAD = b"needle\n" + b"x" * 600_000
+
+
+PYTHON_LAYOUT = ("utils.py", "readme.md", "main.py")
+NESTED_LAYOUT = ("top.py", "src/lib/deep.py", ".hidden/secret.py")
+
+python_layout = pytest.mark.parametrize("tree", [PYTHON_LAYOUT], indirect=True, ids=["python"])
+nested_layout = pytest.mark.parametrize("tree", [NESTED_LAYOUT], indirect=True, ids=["nested"])
+
+
+@pytest.fixture(scope="module")
+def tree(request, tmp_path_factory):
+    """Read-only tree built once per module for each layout passed indirectly."""
+    root = tmp_path_factory.mktemp("tree")
+    for relative in request.param:
+        file_path = root / relative
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.touch()
+    return root
+
+
 # =============================================================================
 # glob_files tests
 # =============================================================================
@@ -15,37 +40,41 @@ from radsim.tools.search import glob_files, grep_search
 class TestGlobFiles:
     """Tests for glob_files function."""
 
-    def test_glob_matches_python_files(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "main.py").touch()
-        (tmp_path / "utils.py").touch()
-        (tmp_path / "readme.md").touch()
+    @python_layout
+    def test_glob_matches_python_files(self, tree, monkeypatch):
+        monkeypatch.chdir(tree)
 
-        result = glob_files("*.py", str(tmp_path))
+        result = glob_files("*.py", str(tree))
 
         assert result["success"] is True
         assert result["count"] == 2
         assert "main.py" in result["matches"]
         assert "utils.py" in result["matches"]
 
-    def test_glob_no_matches_returns_empty(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "data.csv").touch()
+    @python_layout
+    def test_glob_no_matches_returns_empty(self, tree, monkeypatch):
+        monkeypatch.chdir(tree)
 
-        result = glob_files("*.py", str(tmp_path))
+        result = glob_files("*.rs", str(tree))
 
         assert result["success"] is True
         assert result["count"] == 0
         assert result["matches"] == []
 
-    def test_glob_nested_directories(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        nested_dir = tmp_path / "src" / "lib"
-        nested_dir.mkdir(parents=True)
-        (nested_dir / "deep.py").touch()
-        (tmp_path / "top.py").touch()
+    @python_layout
+    def test_glob_returns_sorted_matches(self, tree, monkeypatch):
+        monkeypatch.chdir(tree)
 
-        result = glob_files("**/*.py", str(tmp_path))
+        result = glob_files("*", str(tree))
+
+        assert result["success"] is True
+        assert result["matches"] == ["main.py", "readme.md", "utils.py"]
+
+    @nested_layout
+    def test_glob_nested_directories(self, tree, monkeypatch):
+        monkeypatch.chdir(tree)
+
+        result = glob_files("**/*.py", str(tree))
 
         assert result["success"] is True
         assert result["count"] == 2
@@ -53,34 +82,18 @@ class TestGlobFiles:
         assert "deep.py" in matched_names
         assert "top.py" in matched_names
 
-    def test_glob_skips_hidden_files(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "visible.py").touch()
-        hidden_dir = tmp_path / ".hidden"
-        hidden_dir.mkdir()
-        (hidden_dir / "secret.py").touch()
+    @nested_layout
+    def test_glob_skips_hidden_files(self, tree, monkeypatch):
+        monkeypatch.chdir(tree)
 
-        result = glob_files("**/*.py", str(tmp_path))
+        result = glob_files("**/*.py", str(tree))
 
         assert result["success"] is True
         matched_names = [m.split("/")[-1] for m in result["matches"]]
-        assert "visible.py" in matched_names
+        assert "top.py" in matched_names
         assert "secret.py" not in matched_names
 
-    def test_glob_returns_sorted_matches(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "zebra.py").touch()
-        (tmp_path / "alpha.py").touch()
-        (tmp_path / "middle.py").touch()
-
-        result = glob_files("*.py", str(tmp_path))
-
-        assert result["success"] is True
-        assert result["matches"] == sorted(result["matches"])
-
-    def test_glob_invalid_directory_fails(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
+    def test_glob_invalid_directory_fails(self, project_dir):
         result = glob_files("*.py", "/nonexistent/path/that/does/not/exist")
 
         assert result["success"] is False
@@ -94,131 +107,250 @@ class TestGlobFiles:
 class TestGrepSearch:
     """Tests for grep_search function."""
 
-    def test_grep_finds_matching_text(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "code.py"
+    def test_grep_finds_matching_text(self, project_dir):
+        test_file = project_dir / "code.py"
         test_file.write_text("def hello_world():\n    return 42\n")
 
-        result = grep_search("hello_world", str(tmp_path))
+        result = grep_search("hello_world", str(project_dir))
 
         assert result["success"] is True
         assert result["count"] >= 1
         assert any("hello_world" in m["content"] for m in result["matches"])
 
-    def test_grep_no_matches_returns_empty(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "code.py"
+    def test_grep_no_matches_returns_empty(self, project_dir):
+        test_file = project_dir / "code.py"
         test_file.write_text("def greet():\n    pass\n")
 
-        result = grep_search("NONEXISTENT_PATTERN", str(tmp_path))
+        result = grep_search("NONEXISTENT_PATTERN", str(project_dir))
 
         assert result["success"] is True
         assert result["count"] == 0
         assert result["matches"] == []
 
-    def test_grep_regex_pattern(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "data.txt"
+    def test_grep_regex_pattern(self, project_dir):
+        test_file = project_dir / "data.txt"
         test_file.write_text("error: something failed\nwarning: be careful\ninfo: all good\n")
 
-        result = grep_search(r"error|warning", str(tmp_path))
+        result = grep_search(r"error|warning", str(project_dir))
 
         assert result["success"] is True
         assert result["count"] == 2
 
-    def test_grep_invalid_regex_returns_error(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-
-        result = grep_search("[invalid regex", str(tmp_path))
+    def test_grep_invalid_regex_returns_error(self, project_dir):
+        result = grep_search("[invalid regex", str(project_dir))
 
         assert result["success"] is False
         assert "invalid regex" in result["error"].lower()
 
-    def test_grep_case_insensitive(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "mixed.txt"
+    def test_grep_case_insensitive(self, project_dir):
+        test_file = project_dir / "mixed.txt"
         test_file.write_text("Hello\nhELLO\nhello\n")
 
-        result = grep_search("hello", str(tmp_path), ignore_case=True)
+        result = grep_search("hello", str(project_dir), ignore_case=True)
 
         assert result["success"] is True
         assert result["count"] == 3
 
-    def test_grep_file_pattern_filter(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        py_file = tmp_path / "code.py"
+    def test_grep_file_pattern_filter(self, project_dir):
+        py_file = project_dir / "code.py"
         py_file.write_text("target_text = True\n")
-        js_file = tmp_path / "code.js"
+        js_file = project_dir / "code.js"
         js_file.write_text("const target_text = true;\n")
 
-        result = grep_search("target_text", str(tmp_path), file_pattern="*.py")
+        result = grep_search("target_text", str(project_dir), file_pattern="*.py")
 
         assert result["success"] is True
         assert result["count"] == 1
         assert result["matches"][0]["file"].endswith(".py")
 
-    def test_grep_skips_hidden_files(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        visible = tmp_path / "visible.txt"
+    def test_grep_skips_hidden_files(self, project_dir):
+        visible = project_dir / "visible.txt"
         visible.write_text("findme\n")
-        hidden = tmp_path / ".hidden_file"
+        hidden = project_dir / ".hidden_file"
         hidden.write_text("findme\n")
 
-        result = grep_search("findme", str(tmp_path))
+        result = grep_search("findme", str(project_dir))
 
         assert result["success"] is True
         matched_files = [m["file"] for m in result["matches"]]
         assert not any(".hidden_file" in f for f in matched_files)
 
-    def test_grep_reports_line_numbers(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        test_file = tmp_path / "numbered.txt"
+    def test_grep_descends_into_subdirectories_but_not_hidden_ones(self, project_dir):
+        (project_dir / "src" / "pkg").mkdir(parents=True)
+        (project_dir / "src" / "pkg" / "mod.py").write_text("findme\n")
+        (project_dir / ".git").mkdir()
+        (project_dir / ".git" / "config").write_text("findme\n")
+
+        result = grep_search("findme", str(project_dir))
+
+        assert [m["file"] for m in result["matches"]] == [str(Path("src/pkg/mod.py"))]
+
+    def test_grep_reports_line_numbers(self, project_dir):
+        test_file = project_dir / "numbered.txt"
         test_file.write_text("aaa\nbbb\nccc\ntarget\neee\n")
 
-        result = grep_search("target", str(tmp_path))
+        result = grep_search("target", str(project_dir))
 
         assert result["success"] is True
         assert result["matches"][0]["line"] == 4
 
-    def test_grep_reports_files_searched_count(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "file1.txt").write_text("content\n")
-        (tmp_path / "file2.txt").write_text("content\n")
+    def test_grep_reports_files_searched_count(self, project_dir):
+        (project_dir / "file1.txt").write_text("content\n")
+        (project_dir / "file2.txt").write_text("content\n")
 
-        result = grep_search("content", str(tmp_path))
+        result = grep_search("content", str(project_dir))
 
         assert result["success"] is True
         assert result["files_searched"] == 2
 
-    def test_grep_skips_binary_like_extensions(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "visible.txt").write_text("needle\n")
-        (tmp_path / "image.svg").write_text("needle\n")
+    def test_grep_skips_binary_like_extensions(self, project_dir):
+        (project_dir / "visible.txt").write_text("needle\n")
+        (project_dir / "image.svg").write_text("needle\n")
 
         with patch("radsim.tools.search.shutil.which", return_value=None):
-            result = grep_search("needle", str(tmp_path))
+            result = grep_search("needle", str(project_dir))
 
         assert result["success"] is True
         matched_files = [match["file"] for match in result["matches"]]
         assert "visible.txt" in matched_files
         assert "image.svg" not in matched_files
 
-    def test_grep_skips_large_files_in_python_fallback(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
-        (tmp_path / "small.txt").write_text("needle\n")
-        (tmp_path / "large.txt").write_text("needle\n" + ("x" * 600_000))
+    def test_grep_skips_files_with_nul_bytes(self, project_dir):
+        (project_dir / "notes.txt").write_text("needle\n")
+        (project_dir / "blob.dat").write_bytes(b"\x00\x01needle\n")
 
         with patch("radsim.tools.search.shutil.which", return_value=None):
-            result = grep_search("needle", str(tmp_path))
+            result = grep_search("needle", str(project_dir))
+
+        assert [match["file"] for match in result["matches"]] == ["notes.txt"]
+        assert result["files_searched"] == 1
+
+    def test_grep_searches_empty_files_as_one_blank_line(self, project_dir):
+        (project_dir / "__init__.py").write_bytes(b"")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search("^$", str(project_dir))
+
+        assert result["matches"] == [{"file": "__init__.py", "line": 1, "content": ""}]
+        assert result["files_searched"] == 1
+
+    def test_grep_reads_past_the_binary_sniff_window(self, project_dir):
+        filler = "x" * 79 + "\n"
+        (project_dir / "long.txt").write_text(filler * 500 + "needle\n")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search("needle", str(project_dir))
+
+        assert [match["line"] for match in result["matches"]] == [501]
+
+    def test_grep_skips_large_files_in_python_fallback(self, project_dir):
+        (project_dir / "small.txt").write_text("needle\n")
+        (project_dir / "large.txt").write_bytes(_OVERSIZED_PAYLOAD)
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search("needle", str(project_dir))
 
         assert result["success"] is True
         matched_files = [match["file"] for match in result["matches"]]
         assert "small.txt" in matched_files
         assert "large.txt" not in matched_files
 
-    def test_grep_uses_ripgrep_when_available(self, tmp_path, monkeypatch):
-        monkeypatch.chdir(tmp_path)
+    @pytest.mark.parametrize("pattern", ["needle", "need(le)"], ids=["literal", "regex"])
+    def test_grep_python_fallback_literal_and_regex_agree(self, project_dir, pattern):
+        (project_dir / "hay.txt").write_text("one\nneedle here\n\nneedle twice needle\nlast needle")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search(pattern, str(project_dir))
+
+        assert [(match["line"], match["content"]) for match in result["matches"]] == [
+            (2, "needle here"),
+            (4, "needle twice needle"),
+            (5, "last needle"),
+        ]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [b"one\rneedle\r\nneedle\n", b"one\nne\xffedle\nneedle\n"],
+        ids=["carriage_returns", "invalid_utf8"],
+    )
+    def test_grep_python_fallback_literal_matches_decoded_lines(self, project_dir, payload):
+        (project_dir / "hay.txt").write_bytes(payload)
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search("needle", str(project_dir))
+
+        assert [(match["line"], match["content"]) for match in result["matches"]] == [
+            (2, "needle"),
+            (3, "needle"),
+        ]
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected_lines"),
+        [
+            (r"^target$", [3]),
+            (r"target(?!_)", [1, 3]),
+            (r"\Atarget", [1, 2, 3]),
+            (r"\s++$", [1]),
+            (r"\s*+$", [1, 2, 3, 4, 1, 2]),
+        ],
+        ids=["anchored", "lookahead", "start_anchor", "possessive_plus", "possessive_star"],
+    )
+    def test_grep_python_fallback_matches_per_line(self, project_dir, pattern, expected_lines):
+        (project_dir / "lines.txt").write_text("target x  \ntarget_value\ntarget\n")
+        (project_dir / "other.txt").write_text("nothing here\n")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search(pattern, str(project_dir))
+
+        assert [match["line"] for match in result["matches"]] == expected_lines
+        assert result["files_searched"] == 2
+
+    def test_grep_possessive_pattern_across_files(self, project_dir):
+        (project_dir / "f.txt").write_text("a  \n  b\n")
+        (project_dir / "g.txt").write_text("x  \ny\n")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search(r"\s++$", str(project_dir))
+
+        assert sorted((match["file"], match["line"]) for match in result["matches"]) == [
+            ("f.txt", 1),
+            ("g.txt", 1),
+        ]
+
+    def test_grep_possessive_pattern_with_context(self, project_dir):
+        (project_dir / "f.txt").write_text("a  \n  b")
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search(r"\s++$", str(project_dir), context_lines=1)
+
+        assert [match["line"] for match in result["matches"]] == [1]
+
+    def test_grep_stops_at_max_matches(self, project_dir):
+        (project_dir / "a.txt").write_text("hit\n" * 5)
+        (project_dir / "b.txt").write_text("hit\n" * 5)
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            capped = grep_search("hit", str(project_dir), max_matches=3)
+            full = grep_search("hit", str(project_dir), max_matches=50)
+
+        assert (capped["count"], capped["truncated"], capped["files_searched"]) == (3, True, 1)
+        assert (full["count"], full["truncated"]) == (10, False)
+
+    def test_grep_exactly_max_matches_is_not_truncated(self, project_dir):
+        (project_dir / "a.txt").write_text("hit\n" * 3)
+
+        with patch("radsim.tools.search.shutil.which", return_value=None):
+            result = grep_search("hit", str(project_dir), max_matches=3)
+
+        assert (result["count"], result["truncated"]) == (3, False)
+
+    def test_grep_rejects_non_positive_max_matches(self, project_dir):
+        result = grep_search("hit", str(project_dir), max_matches=0)
+
+        assert result["success"] is False
+        assert "max_matches" in result["error"]
 
+    def test_grep_uses_ripgrep_when_available(self, project_dir):
         completed_process = type(
             "CompletedProcess",
             (),
@@ -231,7 +363,7 @@ class TestGrepSearch:
 
         with patch("radsim.tools.search.shutil.which", return_value="/usr/bin/rg"):
             with patch("radsim.tools.search.subprocess.run", return_value=completed_process) as mock_run:
-                result = grep_search("target_value", str(tmp_path))
+                result = grep_search("target_value", str(project_dir))
 
         assert result["success"] is True
         assert result["matches"][0]["file"] == "code.py"
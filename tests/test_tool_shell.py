@@ -1,23 +1,17 @@
 """Tests for radsim/tools/shell.py
 
-One test, one thing. Mock subprocess.run for shell tests.
+One test, one thing. Mock subprocess.Popen for shell tests.
 """
 
-from unittest.mock import MagicMock, patch
-
+from radsim.tools.constants import MAX_OUTPUT_SIZE
 from radsim.tools.shell import run_shell_command
 
 
 class TestRunShellCommand:
     """Tests for run_shell_command function."""
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_simple_echo_returns_stdout(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="hello world\n",
-            stderr="",
-        )
+    def test_simple_echo_returns_stdout(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(0, "hello world\n", "")
 
         result = run_shell_command("echo hello world")
 
@@ -25,13 +19,8 @@ class TestRunShellCommand:
         assert "hello world" in result["stdout"]
         assert result["returncode"] == 0
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_nonzero_exit_code_reports_failure(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stdout="",
-            stderr="command failed\n",
-        )
+    def test_nonzero_exit_code_reports_failure(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(1, "", "command failed\n")
 
         result = run_shell_command("false")
 
@@ -39,44 +28,33 @@ class TestRunShellCommand:
         assert result["returncode"] == 1
         assert "command failed" in result["stderr"]
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_timeout_returns_error(self, mock_run):
-        import subprocess
-
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 999", timeout=5)
+    def test_timeout_kills_process_and_returns_error(self, mock_popen, fake_process):
+        mock_popen.return_value = process = fake_process(hangs=True)
 
         result = run_shell_command("sleep 999", timeout=5)
 
         assert result["success"] is False
         assert "timed out" in result["error"].lower()
+        assert (process.killed, process.reaped) == (True, True)
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_output_capture_includes_stderr(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="normal output",
-            stderr="warning message",
-        )
+    def test_output_capture_includes_stderr(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(0, "normal output", "warning message")
 
         result = run_shell_command("some_command")
 
         assert result["stdout"] == "normal output"
         assert result["stderr"] == "warning message"
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_large_stdout_is_truncated(self, mock_run):
+    def test_large_stdout_is_truncated(self, mock_popen, fake_process):
         large_output = "x" * 100_000
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=large_output,
-            stderr="",
-        )
+        mock_popen.return_value = fake_process(0, large_output, "")
 
         result = run_shell_command("big_output_cmd")
 
         assert result["success"] is True
-        assert "truncated" in result["stdout"].lower()
-        assert len(result["stdout"]) < 100_000
+        kept, notice = result["stdout"].split("\n", 1)
+        assert kept == "x" * MAX_OUTPUT_SIZE
+        assert "truncated" in notice.lower()
 
     def test_empty_command_rejected(self):
         result = run_shell_command("")
@@ -84,17 +62,12 @@ class TestRunShellCommand:
         assert result["success"] is False
         assert "empty" in result["error"].lower()
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_working_dir_is_passed_to_subprocess(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="",
-            stderr="",
-        )
+    def test_working_dir_is_passed_to_subprocess(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(0, "", "")
 
         run_shell_command("ls", working_dir="/tmp")
 
-        call_kwargs = mock_run.call_args
+        call_kwargs = mock_popen.call_args
         assert call_kwargs.kwargs["cwd"] == "/tmp"
 
 
@@ -107,13 +80,8 @@ class TestDangerousCommandValidation:
         assert result["success"] is False
         assert "traversal" in result["error"].lower()
 
-    @patch("radsim.tools.shell.subprocess.run")
-    def test_normal_command_is_allowed(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="file.txt",
-            stderr="",
-        )
+    def test_normal_command_is_allowed(self, mock_popen, fake_process):
+        mock_popen.return_value = fake_process(0, "file.txt", "")
 
         result = run_shell_command("ls -la")
 
@@ -173,6 +173,13 @@ class TestIsProtectedPath:
 
         assert is_protected is True
 
+    def test_reason_names_first_listed_pattern(self):
+        """When several patterns match, the reason follows PROTECTED_PATTERNS order."""
+        is_protected, reason = is_protected_path("deploy/token/secrets.yaml")
+
+        assert is_protected is True
+        assert reason == "Protected file pattern: secrets"
+
     def test_normal_python_file_not_protected(self):
         is_protected, reason = is_protected_path("src/main.py")
 
@@ -5,8 +5,9 @@
 """Tests for the auto-update checker."""
 
 import json
+import os
 import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from radsim.update_checker import (
     _cache_is_fresh,
@@ -45,6 +46,12 @@ class TestVersionComparison:
     def test_empty_version(self):
         assert _version_is_newer("", "1.2.0") is False
 
+    def test_prerelease_suffix_is_invalid(self):
+        assert _version_is_newer("1.3.0-rc1", "1.2.0") is False
+
+    def test_multi_digit_segments_compare_numerically(self):
+        assert _version_is_newer("1.10.0", "1.9.9") is True
+
 
 class TestCache:
     """Tests for cache read/write/freshness."""
@@ -64,6 +71,8 @@ class TestCache:
 
         data = {"checked_at": time.time() - (25 * 3600), "latest_version": "1.3.0"}
         cache_file.write_text(json.dumps(data))
+        stale_time = time.time() - (25 * 3600)
+        os.utime(cache_file, (stale_time, stale_time))
 
         assert _cache_is_fresh() is False
 
@@ -118,6 +127,20 @@ class TestCheckForUpdates:
 
         assert check_for_updates("1.1.0") == "2.0.0"
 
+    def test_fetches_and_caches_newer_release(self, tmp_path, monkeypatch):
+        cache_file = tmp_path / "update_check.json"
+        monkeypatch.setattr("radsim.update_checker.CACHE_FILE", cache_file)
+        monkeypatch.setattr("radsim.update_checker.CACHE_DIR", tmp_path)
+        monkeypatch.delenv("RADSIM_SKIP_UPDATE_CHECK", raising=False)
+
+        response = MagicMock()
+        response.read.return_value = b'{"tag_name": "v9.0.0"}'
+        response.__enter__.return_value = response
+
+        with patch("urllib.request.urlopen", return_value=response):
+            assert check_for_updates("1.0.0") == "9.0.0"
+        assert _get_cached_version() == "9.0.0"
+
     def test_network_failure_returns_none(self, tmp_path, monkeypatch):
         cache_file = tmp_path / "nonexistent.json"
         monkeypatch.setattr("radsim.update_checker.CACHE_FILE", cache_file)